@@ -2,6 +2,8 @@
 
 import os
 import time
+from copy import deepcopy
+from functools import lru_cache
 
 import numpy as np
 
@@ -17,6 +19,37 @@ from tvb.datatypes.connectivity import Connectivity
 from examples.plot_write_results import plot_write_results
 
 
+# The arguments common to all examples, as (key, default) tuples, to be popped by pop_kwargs:
+EXAMPLE_KWARGS = (("spiking_proxy_inds", (0, 1)),
+                  ("population_order", 100),
+                  ("model", "RATE"),
+                  ("input_flag", True),
+                  ("output_flag", True))
+
+
+def pop_kwargs(kwargs, spec):
+    """This function pops the arguments of an example from its keyword arguments, in a single pass.
+       Arguments:
+        - kwargs: the dictionary of keyword arguments.
+        - spec: a tuple of (key, default) tuples.
+                The default value is used if the key is not in kwargs.
+       Returns:
+        a tuple of the popped values, in the order of spec
+    """
+    return tuple(kwargs.pop(key, default) for key, default in spec)
+
+
+@lru_cache(maxsize=8)
+def _load_connectivity(filepath):
+    return Connectivity.from_file(filepath)
+
+
+def load_connectivity(filepath):
+    """This function parses each connectivity file only once, for all the examples run by the same process,
+       and returns a copy of the parsed Connectivity, because the cosimulator builder modifies it in place."""
+    return deepcopy(_load_connectivity(filepath))
+
+
 def results_path_fun(spikeNet_model_builder, tvb_to_spikeNet_mode, spikeNet_to_tvb, config=None):
     if config is None:
         if tvb_to_spikeNet_mode is not None:
@@ -74,7 +107,7 @@ def main_example(orchestrator_app, tvb_sim_model, model_params={},
     orchestrator.tvb_app.cosimulator_builder.model = tvb_sim_model
     orchestrator.tvb_app.cosimulator_builder.model_params = model_params
     if not isinstance(connectivity, Connectivity):
-        connectivity = Connectivity.from_file(connectivity)
+        connectivity = load_connectivity(connectivity)
     orchestrator.tvb_app.cosimulator_builder.connectivity = connectivity
     orchestrator.tvb_app.cosimulator_builder.delays_flag = delays_flag
     if initial_conditions is not None:
@@ -163,15 +196,17 @@ def default_example(spikeNet_model_builder, tvb_spikeNet_model_builder, orchestr
 
     model_params.update(kwargs.pop("model_params", {}))
 
-    spikeNet_model_builder.population_order = kwargs.pop("population_order", 100)
+    spiking_proxy_inds, population_order, model, input_flag, output_flag = pop_kwargs(kwargs, EXAMPLE_KWARGS)
+
+    spikeNet_model_builder.population_order = population_order
 
-    model = kwargs.pop("model", "RATE").upper()
+    model = model.upper()
     tvb_spikeNet_model_builder.model = model
     tvb_to_spikeNet_interfaces = []
     spikeNet_to_tvb_interfaces = []
     tvb_spikeNet_model_builder.N_E = spikeNet_model_builder.population_order
-    tvb_spikeNet_model_builder.input_flag = kwargs.pop("input_flag", True)
-    tvb_spikeNet_model_builder.output_flag = kwargs.pop("output_flag", True)
+    tvb_spikeNet_model_builder.input_flag = input_flag
+    tvb_spikeNet_model_builder.output_flag = output_flag
 
     # An example of a minimal configuration:
     # tvb_to_spikeNet_interfaces = [{"model": model, "voi": "R", "populations": "E"}]
@@ -179,5 +214,5 @@ def default_example(spikeNet_model_builder, tvb_spikeNet_model_builder, orchestr
 
     return main_example(orchestrator_app,
                         Linear(), model_params,
-                        spikeNet_model_builder, kwargs.pop("spiking_proxy_inds", [0, 1]),
+                        spikeNet_model_builder, spiking_proxy_inds,
                         tvb_spikeNet_model_builder, tvb_to_spikeNet_interfaces, spikeNet_to_tvb_interfaces, **kwargs)
@@ -1,27 +1,25 @@
 # -*- coding: utf-8 -*-
 
-import numpy as np
-
 from tvb_multiscale.core.tvb.cosimulator.models.reduced_wong_wang_exc_io import ReducedWongWangExcIO
 from tvb_multiscale.core.tvb.cosimulator.models.reduced_wong_wang_exc_io_inh_i import ReducedWongWangExcIOInhI
 
-from examples.example import main_example
+from examples.example import EXAMPLE_KWARGS, pop_kwargs, main_example
 
 
 def red_wong_wang_excio_example(spikeNet_model_builder, tvb_spikeNet_model_builder, orchestrator_app, **kwargs):
 
-    spiking_proxy_inds = kwargs.pop("spiking_proxy_inds", [0, 1])
-    spikeNet_model_builder.population_order = kwargs.pop("population_order", 100)
+    spiking_proxy_inds, population_order, model, input_flag, output_flag = pop_kwargs(kwargs, EXAMPLE_KWARGS)
+    spikeNet_model_builder.population_order = population_order
 
     model_params = kwargs.pop("model_params", {})
 
-    model = kwargs.pop("model", "RATE").upper()
-    tvb_spikeNet_model_builder.input_flag = kwargs.pop("input_flag", True)
-    tvb_spikeNet_model_builder.output_flag = kwargs.pop("output_flag", True)
+    model = model.upper()
+    tvb_spikeNet_model_builder.input_flag = input_flag
+    tvb_spikeNet_model_builder.output_flag = output_flag
     tvb_spikeNet_model_builder.default_coupling_mode = "TVB"
     tvb_spikeNet_model_builder.model = model
     tvb_spikeNet_model_builder.N_E = \
-        int(np.round(spikeNet_model_builder.scale * spikeNet_model_builder.population_order))
+        round(spikeNet_model_builder.scale * spikeNet_model_builder.population_order)
 
     tvb_to_spikeNet_interfaces = []
     spikeNet_to_tvb_interfaces = []
@@ -88,19 +86,19 @@ def red_wong_wang_excio_example(spikeNet_model_builder, tvb_spikeNet_model_build
 
 def red_wong_wang_excio_inhi_example(spikeNet_model_builder, tvb_spikeNet_model_builder, orchestrator_app, **kwargs):
 
-    spiking_proxy_inds = kwargs.pop("spiking_proxy_inds", [0, 1])
-    spikeNet_model_builder.population_order = kwargs.pop("population_order", 100)
+    spiking_proxy_inds, population_order, model, input_flag, output_flag = pop_kwargs(kwargs, EXAMPLE_KWARGS)
+    spikeNet_model_builder.population_order = population_order
 
     model_params = kwargs.pop("model_params", {})
 
-    model = kwargs.pop("model", "RATE").upper()
+    model = model.upper()
     tvb_spikeNet_model_builder.model = model
-    tvb_spikeNet_model_builder.input_flag = kwargs.pop("input_flag", True)
-    tvb_spikeNet_model_builder.output_flag = kwargs.pop("output_flag", True)
+    tvb_spikeNet_model_builder.input_flag = input_flag
+    tvb_spikeNet_model_builder.output_flag = output_flag
     tvb_spikeNet_model_builder.N_E = \
-        int(np.round(spikeNet_model_builder.scale_e * spikeNet_model_builder.population_order))
+        round(spikeNet_model_builder.scale_e * spikeNet_model_builder.population_order)
     tvb_spikeNet_model_builder.N_I = \
-        int(np.round(spikeNet_model_builder.scale_i * spikeNet_model_builder.population_order))
+        round(spikeNet_model_builder.scale_i * spikeNet_model_builder.population_order)
     tvb_to_spikeNet_interfaces = []
     spikeNet_to_tvb_interfaces = []
 
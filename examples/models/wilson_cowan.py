@@ -1,54 +1,48 @@
 # -*- coding: utf-8 -*-
 
+from types import MappingProxyType
+
 import numpy as np
 
 from tvb_multiscale.core.tvb.cosimulator.models.wilson_cowan_constraint import WilsonCowan
-from examples.example import main_example
+from examples.example import EXAMPLE_KWARGS, pop_kwargs, main_example
 
 
-def wilson_cowan_example(spikeNet_model_builder, tvb_spikeNet_model_builder, orchestrator_app, **kwargs):
+# -----------------------------------Wilson Cowan oscillatory regime------------------------------------------------
+
+_WC_PARAMS_NAMES = ("r_e", "r_i", "k_e", "k_i", "tau_e", "tau_i",
+                    "c_ee", "c_ei", "c_ie", "c_ii", "alpha_e", "alpha_i",
+                    "a_e", "a_i", "b_e", "b_i", "c_e", "c_i",
+                    "theta_e", "theta_i", "P", "Q")
+
+_WC_PARAMS_DEFAULTS = np.array([0.0, 0.0, 1.0, 1.0, 10.0, 10.0,
+                                10.0, 6.0, 10.0, 1.0, 1.2, 2.0,
+                                1.0, 1.0, 0.0, 0.0, 1.0, 1.0,
+                                2.0, 3.5, 0.5, 0.0], dtype=np.float64)
+_WC_PARAMS_DEFAULTS.flags.writeable = False
 
-    # -----------------------------------Wilson Cowan oscillatory regime------------------------------------------------
-
-    model_params = {
-        "r_e": np.array([0.0]),
-        "r_i": np.array([0.0]),
-        "k_e": np.array([1.0]),
-        "k_i": np.array([1.0]),
-        "tau_e": np.array([10.0]),
-        "tau_i": np.array([10.0]),
-        "c_ee": np.array([10.0]),
-        "c_ei": np.array([6.0]),
-        "c_ie": np.array([10.0]),
-        "c_ii": np.array([1.0]),
-        "alpha_e": np.array([1.2]),
-        "alpha_i": np.array([2.0]),
-        "a_e": np.array([1.0]),
-        "a_i": np.array([1.0]),
-        "b_e": np.array([0.0]),
-        "b_i": np.array([0.0]),
-        "c_e": np.array([1.0]),
-        "c_i": np.array([1.0]),
-        "theta_e": np.array([2.0]),
-        "theta_i": np.array([3.5]),
-        "P": np.array([0.5]),
-        "Q": np.array([0.0])
-    }
+# Every default parameter is a read-only 1-element view into the single contiguous buffer above:
+_WC_DEFAULT_PARAMS = MappingProxyType(
+    dict((name, _WC_PARAMS_DEFAULTS[ii:ii+1]) for ii, name in enumerate(_WC_PARAMS_NAMES)))
 
+
+def wilson_cowan_example(spikeNet_model_builder, tvb_spikeNet_model_builder, orchestrator_app, **kwargs):
+
+    model_params = dict(_WC_DEFAULT_PARAMS)
     model_params.update(kwargs.pop("model_params", {}))
 
-    spikeNet_model_builder.population_order = kwargs.pop("population_order", 100)
+    spiking_proxy_inds, population_order, model, input_flag, output_flag = pop_kwargs(kwargs, EXAMPLE_KWARGS)
+
+    spikeNet_model_builder.population_order = population_order
 
-    model = kwargs.pop("model", "RATE").upper()
+    model = model.upper()
 
     tvb_spikeNet_model_builder.model = model
-    tvb_spikeNet_model_builder.input_flag = kwargs.pop("input_flag", True)
-    tvb_spikeNet_model_builder.output_flag = kwargs.pop("output_flag", True)
+    tvb_spikeNet_model_builder.input_flag = input_flag
+    tvb_spikeNet_model_builder.output_flag = output_flag
     tvb_spikeNet_model_builder.default_coupling_mode = "TVB"
-    tvb_spikeNet_model_builder.N_E = int(
-        np.round(spikeNet_model_builder.scale_e * spikeNet_model_builder.population_order))
-    tvb_spikeNet_model_builder.N_I = int(
-        np.round(spikeNet_model_builder.scale_i * spikeNet_model_builder.population_order))
+    tvb_spikeNet_model_builder.N_E = round(spikeNet_model_builder.scale_e * spikeNet_model_builder.population_order)
+    tvb_spikeNet_model_builder.N_I = round(spikeNet_model_builder.scale_i * spikeNet_model_builder.population_order)
     tvb_to_spikeNet_interfaces = []
     spikeNet_to_tvb_interfaces = []
 
@@ -98,6 +92,6 @@ def wilson_cowan_example(spikeNet_model_builder, tvb_spikeNet_model_builder, orc
 
     return main_example(orchestrator_app,
                         WilsonCowan(), model_params,
-                        spikeNet_model_builder, kwargs.pop("spiking_proxy_inds", [0, 1]),
+                        spikeNet_model_builder, spiking_proxy_inds,
                         tvb_spikeNet_model_builder, tvb_to_spikeNet_interfaces, spikeNet_to_tvb_interfaces, **kwargs)
 
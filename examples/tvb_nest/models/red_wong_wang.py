@@ -1,29 +1,34 @@
 # -*- coding: utf-8 -*-
 
-from tvb_multiscale.tvb_nest.interfaces.models.red_wong_wang import \
-    RedWongWangExcIOTVBNESTInterfaceBuilder, RedWongWangExcIOInhITVBNESTInterfaceBuilder
-from tvb_multiscale.tvb_nest.nest_models.models.default import DefaultExcIOBuilder
-from tvb_multiscale.tvb_nest.nest_models.models.ww_deco import WWDeco2013Builder, WWDeco2014Builder
-
 from examples.tvb_nest.example import main_example
 from examples.models.red_wong_wang import \
     red_wong_wang_excio_example as red_wong_wang_excio_example_base, \
     red_wong_wang_excio_inhi_example as red_wong_wang_excio_inhi_example_bae
 
 
+# The NEST model and interface builders are imported within each example,
+# so that only the modules of the example actually run are loaded.
+
+
 def red_wong_wang_excio_example(**kwargs):
+    from tvb_multiscale.tvb_nest.interfaces.models.red_wong_wang import RedWongWangExcIOTVBNESTInterfaceBuilder
+    from tvb_multiscale.tvb_nest.nest_models.models.default import DefaultExcIOBuilder
     return main_example(red_wong_wang_excio_example_base,
                         DefaultExcIOBuilder(), RedWongWangExcIOTVBNESTInterfaceBuilder(),
                         **kwargs)
 
 
 def red_wong_wang_excio_inhi_example_2013(**kwargs):
+    from tvb_multiscale.tvb_nest.interfaces.models.red_wong_wang import RedWongWangExcIOInhITVBNESTInterfaceBuilder
+    from tvb_multiscale.tvb_nest.nest_models.models.ww_deco import WWDeco2013Builder
     return main_example(red_wong_wang_excio_inhi_example_bae,
                         WWDeco2013Builder(), RedWongWangExcIOInhITVBNESTInterfaceBuilder(),
                         **kwargs)
 
 
 def red_wong_wang_excio_inhi_example_2014(**kwargs):
+    from tvb_multiscale.tvb_nest.interfaces.models.red_wong_wang import RedWongWangExcIOInhITVBNESTInterfaceBuilder
+    from tvb_multiscale.tvb_nest.nest_models.models.ww_deco import WWDeco2014Builder
     return main_example(red_wong_wang_excio_inhi_example_bae,
                         WWDeco2014Builder(), RedWongWangExcIOInhITVBNESTInterfaceBuilder(),
                         **kwargs)
@@ -31,9 +36,5 @@ def red_wong_wang_excio_inhi_example_2014(**kwargs):
 
 if __name__ == "__main__":
     import sys
-    if sys.argv[-1] == "1":
-        red_wong_wang_excio_inhi_example_2013(model="RATE")
-    elif sys.argv[-1] == "2":
-        red_wong_wang_excio_inhi_example_2014(model="RATE")
-    else:
-        red_wong_wang_excio_example(model="RATE")
+    {"1": red_wong_wang_excio_inhi_example_2013,
+     "2": red_wong_wang_excio_inhi_example_2014}.get(sys.argv[-1], red_wong_wang_excio_example)(model="RATE")
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+import warnings
+
+import numpy as np
+import pytest
+
+from tvb_multiscale.core.utils.data_structures_utils import extract_integer_intervals
+
+
+class TestExtractIntegerIntervals:
+
+    @pytest.mark.parametrize('iterable, intervals',
+                             [([], []),
+                              ([3], [(3, 3)]),
+                              ([0, 1, 2, 3], [(0, 3)]),
+                              ([0, 1, 1, 2, 2, 2], [(0, 2)]),
+                              ([5, 2, 4, 3, 0], [(0, 0), (2, 5)]),
+                              ([0, 1, 3, 5, 6, 7, 10], [(0, 1), (3, 3), (5, 7), (10, 10)]),
+                              (np.array([[7, 8], [1, 2]]), [(1, 2), (7, 8)])])
+    def test_intervals(self, iterable, intervals):
+        assert extract_integer_intervals(iterable) == intervals
+
+    @pytest.mark.parametrize('iterable, intervals',
+                             [([], ""),
+                              ([3], "(3, 3)"),
+                              ([0, 1, 1, 2], "(0, 2)"),
+                              ([6, 0, 5, 1, 3], "(0, 1), (3, 3), (5, 6)")])
+    def test_intervals_as_string(self, iterable, intervals):
+        assert extract_integer_intervals(iterable, as_string=True) == intervals
+
+    def test_print_is_deprecated(self):
+        with pytest.warns(DeprecationWarning):
+            intervals = extract_integer_intervals([0, 1, 3], print=True)
+        assert intervals == "(0, 1), (3, 3)"
+
+    def test_as_string_is_not_deprecated(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            assert extract_integer_intervals([0, 1, 3], as_string=True) == "(0, 1), (3, 3)"
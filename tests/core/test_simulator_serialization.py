@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 
 import os
+import hashlib
+from copy import deepcopy
+from functools import lru_cache
+
 import numpy as np
 import pytest
 
@@ -23,18 +27,41 @@ from tvb_multiscale.core.tvb.cosimulator.cosimulator_serialization import serial
 TEST_MODELS = [Linear, WilsonCowan, LinearReducedWongWangExcIO, ReducedWongWangExcIO, ReducedWongWangExcIOInhI]
 
 
+@lru_cache(maxsize=None)
+def _load_default_connectivity():
+    return Connectivity.from_file(CONFIGURED.DEFAULT_CONNECTIVITY_ZIP)
+
+
+def default_connectivity():
+    # The zip file is parsed only once for all tests.
+    # Each test gets its own copy, because the builder modifies the connectivity in place:
+    return deepcopy(_load_default_connectivity())
+
+
+def data_digest(val):
+    # The shape, dtype and a hash of the raw data of numeric arrays, or None for any other value:
+    if isinstance(val, np.ndarray) and not val.dtype.hasobject:
+        return val.shape, val.dtype.str, hashlib.blake2b(np.ascontiguousarray(val)).digest()
+    return None
+
+
 class TestSimulatorSerialization:
 
     @pytest.mark.parametrize('test_model', TEST_MODELS)
     def test_simulator_serialization(self, test_model):
         simulator_builder = CoSimulatorSerialBuilder()
-        simulator_builder.connectivity = Connectivity.from_file(CONFIGURED.DEFAULT_CONNECTIVITY_ZIP)
+        simulator_builder.connectivity = default_connectivity()
         model = test_model()
         simulator_builder.model = model
         simulator = simulator_builder.build()
         serial_sim = serialize_tvb_cosimulator(simulator)
+        digests = dict((key, data_digest(val)) for key, val in serial_sim.items())
         filepath = os.path.join(CONFIGURED.out.FOLDER_RES, serial_sim["model"] + ".pkl")
         dump_pickled_dict(serial_sim, filepath)
-        serial_sim2 = load_pickled_dict(filepath)
+        # The arrays' data are compared directly from the memory mapped file:
+        serial_sim2 = load_pickled_dict(filepath, mmap_mode=True)
         for key, val in serial_sim.items():
-            assert np.all(serial_sim2[key] == val)
+            if digests[key] is None:
+                assert np.array_equal(serial_sim2[key], val)
+            else:
+                assert data_digest(serial_sim2[key]) == digests[key]
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from tvb.basic.profile import TvbProfile
+TvbProfile.set_profile(TvbProfile.LIBRARY_PROFILE)
+
+from tvb_multiscale.core.spiking_models.node import SpikingNodeCollection
+from tvb_multiscale.core.spiking_models.devices import InputDevice, OutputDevice
+
+
+class ArraySpikingNodeCollection(SpikingNodeCollection):
+
+    """A SpikingNodeCollection of a numpy array of gids, without a spiking simulator."""
+
+    @property
+    def spiking_simulator_module(self):
+        return None
+
+    def _assert_spiking_simulator(self):
+        pass
+
+    def _assert_nodes(self, nodes=None):
+        return self._nodes if nodes is None else nodes
+
+    def _get_gids(self):
+        return self._nodes
+
+    def _Set(self, values_dict, nodes=None):
+        pass
+
+    def _Get(self, attr=None, nodes=None):
+        return {}
+
+    def _GetConnections(self, nodes=None, source_or_target=None):
+        return []
+
+    def _SetToConnections(self, values_dict, connections=None):
+        pass
+
+    def _GetFromConnections(self, attrs=None, connections=None):
+        return {}
+
+
+class TestGidsToLocalIndices:
+
+    # Dense gids are looked up via a direct-address array, and sparse ones via a dictionary:
+    @pytest.mark.parametrize('gids, table_type', [(np.array([5, 3, 4, 10]), np.ndarray),
+                                                  (np.array([10**9, 7, 10**6]), dict)])
+    def test_get_local_inds(self, gids, table_type):
+        nodes = ArraySpikingNodeCollection(gids)
+        assert isinstance(nodes._get_gids_to_local(), table_type)
+        assert np.array_equal(nodes.get_local_inds(gids[::-1]), np.arange(gids.size)[::-1])
+        assert nodes.get_local_inds(gids[1]) == 1
+        assert np.array_equal(nodes.get_nodes_by_gids(gids[[2, 0]]), gids[[2, 0]])
+
+    @pytest.mark.parametrize('gids', [np.array([5, 3, 4, 10]), np.array([10**9, 7, 10**6])])
+    def test_get_local_inds_of_unknown_gids(self, gids):
+        nodes = ArraySpikingNodeCollection(gids)
+        for unknown_gids in [[gids[0], 6], 11, -1, [2 * 10**9]]:
+            with pytest.raises(ValueError):
+                nodes.get_local_inds(unknown_gids)
+        with pytest.raises(ValueError):
+            nodes.get_nodes_by_gids([6])
+
+
+class TestFromBulk:
+
+    def test_from_bulk_broadcasts_scalar_labels(self):
+        nodes_list = [np.array([0, 1]), np.array([2]), np.array([3, 4, 5])]
+        objs = ArraySpikingNodeCollection.from_bulk(nodes_list, labels="E", brain_regions="region")
+        assert len(objs) == len(nodes_list)
+        for obj, nodes in zip(objs, nodes_list):
+            assert isinstance(obj, ArraySpikingNodeCollection)
+            assert obj.label == "E"
+            assert obj.model == ArraySpikingNodeCollection.__name__
+            assert obj.brain_region == "region"
+            assert np.array_equal(obj.gids, nodes)
+        # Each instance gets its own gid:
+        assert len(set(obj.gid for obj in objs)) == len(objs)
+
+    def test_from_bulk_per_node_labels(self):
+        nodes_list = [np.array([0, 1]), np.array([2])]
+        objs = ArraySpikingNodeCollection.from_bulk(nodes_list, labels=["E", "I"], models=("exc", "inh"),
+                                                    brain_regions=["left", "right"])
+        assert [obj.label for obj in objs] == ["E", "I"]
+        assert [obj.model for obj in objs] == ["exc", "inh"]
+        assert [obj.brain_region for obj in objs] == ["left", "right"]
+
+    @pytest.mark.parametrize('kwargs', [{"labels": ["E"]},
+                                        {"models": ["exc", "inh", "exc"]},
+                                        {"brain_regions": []}])
+    def test_from_bulk_length_mismatch(self, kwargs):
+        with pytest.raises(ValueError):
+            ArraySpikingNodeCollection.from_bulk([np.array([0, 1]), np.array([2])], **kwargs)
+
+
+class ArrayDevice(ArraySpikingNodeCollection):
+
+    """A device of a numpy array of gids, the connections of which are (gid, direction) tuples,
+       with weight 1.0 for the connections the device is the source of, and 2.0 for those it is the target of."""
+
+    _weight_attr = "weight"
+
+    def _assert_device(self):
+        pass
+
+    def get_neurons(self):
+        return ()
+
+    @property
+    def neurons(self):
+        return self.get_neurons()
+
+    def _GetConnections(self, nodes=None, source_or_target=None):
+        return [(gid, source_or_target) for gid in self._assert_nodes(nodes)]
+
+    def _GetFromConnections(self, attrs=None, connections=None):
+        return {"weight": [{"source": 1.0, "target": 2.0}[direction] for _, direction in connections]}
+
+
+class ArrayInputDevice(ArrayDevice, InputDevice):
+    pass
+
+
+class ArrayOutputDevice(ArrayDevice, OutputDevice):
+    pass
+
+
+class TestDevicesConnections:
+
+    # Devices get the connections of their single direction, even if both directions are requested:
+    @pytest.mark.parametrize('device_class, direction, weight', [(ArrayInputDevice, "source", 1.0),
+                                                                 (ArrayOutputDevice, "target", 2.0)])
+    def test_devices_connections(self, device_class, direction, weight):
+        device = device_class(np.array([3, 4]))
+        connections = [(3, direction), (4, direction)]
+        assert device._GetConnectionsBatch() == (connections, connections)
+        assert device.get_weights() == ([weight, weight], [weight, weight])
+        assert device.node_weight == weight
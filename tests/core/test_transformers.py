@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from tvb.basic.profile import TvbProfile
+TvbProfile.set_profile(TvbProfile.LIBRARY_PROFILE)
+
+from tvb.simulator.integrators import HeunStochastic
+from tvb.simulator.noise import Additive
+
+from tvb_multiscale.core.interfaces.base.transformers.models.red_wong_wang import RedWongWangExc, RedWongWangInh
+
+
+def compute_next_step(transformer_class, use_numba, state, input_buffer_element, nsig=0.0):
+    transformer = transformer_class(dt=0.1, state=state.copy(),
+                                    integrator=HeunStochastic(dt=0.1,
+                                                              noise=Additive(nsig=np.array([nsig]), noise_seed=42)))
+    transformer.use_numba = use_numba
+    transformer.configure()
+    transformer.compute_next_step(input_buffer_element)
+    return transformer.state
+
+
+def random_state_and_input(rng, n_proxies=5):
+    state = np.array([rng.uniform(0.0, 1.0, n_proxies),      # S
+                      rng.uniform(0.0, 100.0, n_proxies)])   # R
+    input_buffer_element = rng.uniform(0.0, 100.0, (1, n_proxies))
+    return state, input_buffer_element
+
+
+class TestNumbaHeunStochasticStep:
+
+    @pytest.mark.parametrize('transformer_class', [RedWongWangExc, RedWongWangInh])
+    def test_numba_heun_stochastic_step(self, transformer_class):
+        state, input_buffer_element = random_state_and_input(np.random.default_rng(42))
+        expected = compute_next_step(transformer_class, False, state, input_buffer_element)
+        assert np.allclose(compute_next_step(transformer_class, True, state, input_buffer_element), expected)
+
+    @pytest.mark.parametrize('transformer_class', [RedWongWangExc, RedWongWangInh])
+    def test_numba_heun_stochastic_step_with_noise(self, transformer_class, monkeypatch):
+        rng = np.random.default_rng(42)
+        state, input_buffer_element = random_state_and_input(rng)
+        # Both integrations get the same fixed noise realization,
+        # a copy of which is returned each time, since the TVB scheme scales it in place:
+        noise = rng.standard_normal(state.shape)
+        monkeypatch.setattr(Additive, "generate", lambda self, shape, *args, **kwargs: noise.copy())
+        expected = compute_next_step(transformer_class, False, state, input_buffer_element, nsig=0.01)
+        assert not np.allclose(expected, compute_next_step(transformer_class, False, state, input_buffer_element))
+        assert np.allclose(compute_next_step(transformer_class, True, state, input_buffer_element, nsig=0.01),
+                           expected)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from tvb.basic.profile import TvbProfile
+TvbProfile.set_profile(TvbProfile.LIBRARY_PROFILE)
+
+from tvb_multiscale.core.interfaces.tvb.interfaces import _scatter_cosim_updates, _pack_arrays
+
+
+def scatter_cosim_updates_numpy(cosim_updates, i_interfaces, time_steps, values, voi_loc, proxy_inds_loc):
+    # The reference numpy path, setting the values of each interface via fancy indexing:
+    for ii, i_interface in enumerate(i_interfaces):
+        cosim_updates[np.ix_(time_steps[ii] % cosim_updates.shape[0],
+                             voi_loc[i_interface], proxy_inds_loc[i_interface], [0])] = values[ii][..., None]
+    return cosim_updates
+
+
+class TestScatterCosimUpdates:
+
+    def test_scatter_cosim_updates(self):
+        rng = np.random.default_rng(42)
+        shape = (10, 3, 8, 2)  # (time, voi, proxy, mode)
+        voi_loc = [np.array([0]), np.array([1, 2]), np.array([2, 0])]
+        proxy_inds_loc = [np.array([0, 3, 5]), np.array([1]), np.array([7, 2, 6, 4])]
+        # The last interface does not send any data, and the time steps of the second one wrap around:
+        i_interfaces = [0, 1]
+        time_steps = [np.arange(2, 6), np.arange(8, 13)]
+        values = [rng.standard_normal((len(time_steps[ii]),
+                                       len(voi_loc[i_interface]), len(proxy_inds_loc[i_interface])))
+                  for ii, i_interface in enumerate(i_interfaces)]
+
+        expected = scatter_cosim_updates_numpy(np.full(shape, np.nan), i_interfaces, time_steps, values,
+                                               voi_loc, proxy_inds_loc)
+
+        cosim_updates = np.full(shape, np.nan)
+        time_steps_offsets, time_steps_packed = _pack_arrays(time_steps)
+        _scatter_cosim_updates(cosim_updates, np.array(i_interfaces, dtype=np.int64),
+                               time_steps_packed, time_steps_offsets,
+                               np.concatenate([value.ravel() for value in values]),
+                               *(_pack_arrays(voi_loc) + _pack_arrays(proxy_inds_loc)))
+
+        assert np.array_equal(cosim_updates, expected, equal_nan=True)
@@ -1,14 +1,35 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
+from numba import njit, prange
 
 from tvb.basic.neotraits._attr import NArray
+from tvb.simulator.integrators import HeunStochastic
+from tvb.simulator.noise import Additive
 
 from tvb_multiscale.core.interfaces.base.transformers.models.integration import Integration
 from tvb_multiscale.core.interfaces.base.transformers.models.elephant import \
     ElephantSpikesHistogramRate, ElephantSpikesRate
 
 
+@njit(parallel=True, cache=True)
+def _numba_heun_stochastic_step(X, Rin, tau_s, tau_r, gamma, s_sat, noise, dt):
+    "Heun stochastic integration step of the Reduced Wong-Wang synaptic gating and rate dynamics, fused per node."
+    X_next = np.empty(X.shape)
+    for i in prange(X.shape[1]):
+        S = X[0, i]
+        R = X[1, i]
+        dS0 = - (S / tau_s[i]) + (1.0 - s_sat * S) * R * gamma[i]
+        dR0 = - (R - Rin[i]) / tau_r[i]
+        S1 = S + dt * dS0 + noise[0, i]
+        R1 = R + dt * dR0 + noise[1, i]
+        dS1 = - (S1 / tau_s[i]) + (1.0 - s_sat * S1) * R1 * gamma[i]
+        dR1 = - (R1 - Rin[i]) / tau_r[i]
+        X_next[0, i] = S + 0.5 * dt * (dS0 + dS1) + noise[0, i]
+        X_next[1, i] = R + 0.5 * dt * (dR0 + dR1) + noise[1, i]
+    return X_next
+
+
 class RedWongWangExc(Integration):
 
     tau_s = NArray(
@@ -26,6 +47,11 @@ class RedWongWangExc(Integration):
         default=np.array([0.641 / 1000, ]),
         doc="""Excitatory population kinetic parameter""")
 
+    # Set to True to use a single Numba kernel for the whole step of a HeunStochastic integrator with Additive noise:
+    use_numba = False
+    # Factor of the saturation term (1 - S) of the synaptic gating dynamics:
+    _s_sat = 1.0
+
     @property
     def _tau_s(self):
         return self._assert_size("tau_s")
@@ -49,6 +75,20 @@ class RedWongWangExc(Integration):
         return np.array([- (X[0] / self._tau_s) + (1 - X[0]) * X[1] * self._gamma,
                          - (X[1] - np.array(input_buffer).flatten())/self._tau_r])
 
+    def compute_next_step(self, input_buffer_element):
+        if self.use_numba and isinstance(self.integrator, HeunStochastic) \
+                and isinstance(self.integrator.noise, Additive):
+            X = self._state
+            n_proxies = X.shape[1]
+            noise = np.broadcast_to(self.integrator.noise.generate(X.shape) * self.integrator.noise.gfun(X), X.shape)
+            self.state = _numba_heun_stochastic_step(
+                X, np.broadcast_to(np.array(input_buffer_element).flatten(), (n_proxies, )),
+                np.broadcast_to(self._tau_s, (n_proxies, )), np.broadcast_to(self._tau_r, (n_proxies, )),
+                np.broadcast_to(self._gamma, (n_proxies, )), self._s_sat, noise, self.integrator.dt)
+            self.state = self.apply_boundaries()
+        else:
+            super(RedWongWangExc, self).compute_next_step(input_buffer_element)
+
     def apply_boundaries(self):
         # Apply boundaries:
         self.state = np.where(self.state < 0.0, 0.0, self.state)           # S, R >= 0.0
@@ -97,6 +137,8 @@ class RedWongWangInh(RedWongWangExc):
         default=np.array([1.0 / 1000, ]),
         doc="""Inhibitory population kinetic parameter""")
 
+    _s_sat = 0.0
+
     def dfun(self, X, coupling=0.0, input_buffer=0.0, stimulus=0.0):
         # Synaptic gating dynamics
         # dS = - (S / self.tau_s) + R * self.gamma
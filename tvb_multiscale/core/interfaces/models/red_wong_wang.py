@@ -430,15 +430,17 @@ class RedWongWangExcIOInhISpikeNetToTVBTransformerBuilder(DefaultInterfaceBuilde
         pass
 
     def default_spikeNet_to_tvb_config(self, interfaces):
-        for interface, model, N, tau_s, tau_r, gamma in \
-                zip(interfaces,
+        # A single allocation for the initial states of all interfaces, each one getting its own view:
+        states = np.zeros((len(interfaces), 2, len(self.proxy_inds)))
+        for interface, state, model, N, tau_s, tau_r, gamma in \
+                zip(interfaces, states,
                     [ElephantSpikesRateRedWongWangExc, ElephantSpikesRateRedWongWangInh],
                     [self.N_E, self.N_I],
                     [self.tau_e, self.tau_i], [self.tau_re, self.tau_ri], [self.gamma_e, self.gamma_i]):
             interface["transformer_model"] = model
             interface["transformer_params"] = \
                 {"scale_factor": np.array([1.0]) / N,
-                 "state": np.zeros((2, len(self.proxy_inds))),
+                 "state": state,
                  "tau_s": tau_s, "tau_r": tau_r, "gamma": gamma}
 
 
@@ -6,9 +6,10 @@ from decimal import Decimal
 import numpy as np
 
 from tvb.basic.neotraits.api import Attr, Float, List, NArray
-from tvb.contrib.scripts.utils.data_structures_utils import extract_integer_intervals, list_of_dicts_to_dict_of_lists
+from tvb.contrib.scripts.utils.data_structures_utils import list_of_dicts_to_dict_of_lists
 
 from tvb_multiscale.core.neotraits import HasTraits
+from tvb_multiscale.core.utils.data_structures_utils import extract_integer_intervals
 from tvb_multiscale.core.interfaces.base.interfaces import \
     SenderInterface, ReceiverInterface, TransformerSenderInterface, ReceiverTransformerInterface, BaseInterfaces
 from tvb_multiscale.core.interfaces.spikeNet.io import SpikeNetInputDeviceSet, SpikeNetOutputDeviceSet
@@ -133,11 +134,11 @@ class SpikeNetOutputInterface(SpikeNetInterface):
         if data is not None:
             if len(data[0]) == 2:
                 # This will work for multimeters:
-                self.times = np.array([np.round(data[0][0] / self.dt),  # start_time_step
-                                       np.round(data[0][1] / self.dt)]).astype("i")  # end_time_step
+                self.times = np.array([round(data[0][0] / self.dt),  # start_time_step
+                                       round(data[0][1] / self.dt)]).astype("i")  # end_time_step
             else:
                 # This will work for spike recorders:
-                time = np.int(np.round(self.time / self.dt))
+                time = int(round(self.time / self.dt))
                 times = self.times.copy()
                 if time > times[1]:
                     times[0] = times[1] + 1
@@ -4,11 +4,12 @@ from abc import ABCMeta, abstractmethod
 from enum import Enum
 
 import numpy as np
+from numba import njit
 
 from tvb.basic.neotraits.api import Attr, Float, Int, NArray
-from tvb.contrib.scripts.utils.data_structures_utils import extract_integer_intervals
 
 from tvb_multiscale.core.neotraits import HasTraits
+from tvb_multiscale.core.utils.data_structures_utils import extract_integer_intervals
 from tvb_multiscale.core.interfaces.base.interfaces import BaseInterface, \
     SenderInterface, ReceiverInterface, TransformerSenderInterface, ReceiverTransformerInterface, BaseInterfaces
 from tvb_multiscale.core.interfaces.spikeNet.interfaces import \
@@ -16,25 +17,79 @@ from tvb_multiscale.core.interfaces.spikeNet.interfaces import \
 from tvb_multiscale.core.interfaces.base.transformers.models.base import Transformer
 
 
+@njit(cache=True)
+def _scatter_cosim_updates(cosim_updates, i_interfaces, time_steps, time_steps_offsets, values,
+                           voi_loc_offsets, voi_loc, proxy_inds_loc_offsets, proxy_inds_loc):
+    # Scatter the flattened values of shape (time, voi, proxy) of each interface i_interfaces[ii]
+    # to the first mode of cosim_updates, wrapping the time steps around the time dimension of cosim_updates.
+    # The time steps of all interfaces, as well as the local voi and proxy indices, are packed in
+    # (offsets, values) arrays, so that the ii-th element spans values[offsets[ii]:offsets[ii+1]]:
+    n_times = cosim_updates.shape[0]
+    i_value = 0
+    for ii in range(i_interfaces.shape[0]):
+        i_interface = i_interfaces[ii]
+        vois = voi_loc[voi_loc_offsets[i_interface]:voi_loc_offsets[i_interface + 1]]
+        proxys = proxy_inds_loc[proxy_inds_loc_offsets[i_interface]:proxy_inds_loc_offsets[i_interface + 1]]
+        for it in range(time_steps_offsets[ii], time_steps_offsets[ii + 1]):
+            i_time = time_steps[it] % n_times
+            for iv in range(vois.shape[0]):
+                for ip in range(proxys.shape[0]):
+                    cosim_updates[i_time, vois[iv], proxys[ip], 0] = values[i_value]
+                    i_value += 1
+
+
+def _build_inds_lookup(simulator_inds):
+    # Inverse lookup table of the (first) position of each simulator index, -1 for the missing ones:
+    simulator_inds = np.asarray(simulator_inds, dtype=np.intp).ravel()
+    if simulator_inds.size == 0:
+        return np.array([], dtype=np.intp)
+    unique_inds, first_positions = np.unique(simulator_inds, return_index=True)
+    lookup = np.full(unique_inds[-1] + 1, -1, dtype=np.intp)
+    lookup[unique_inds] = first_positions
+    return lookup
+
+
+def _tvb_to_proxy_time(values):
+    # Reshape the values of a single voi from TVB (time, voi, proxy) to (proxy, time):
+    return values[:, 0, :].T
+
+
+def _tvb_to_proxy_time_voi(values):
+    # Reshape the values from TVB (time, voi, proxy) to (proxy, time, voi):
+    return np.transpose(values, (2, 0, 1))
+
+
+def _pack_arrays(arrays):
+    """Function to pack a list of 1D integer arrays into a tuple of (offsets, values) arrays,
+       so that the ii-th array is values[offsets[ii]:offsets[ii+1]]."""
+    offsets = np.zeros((len(arrays) + 1, ), dtype=np.int64)
+    offsets[1:] = np.cumsum([len(array) for array in arrays])
+    if len(arrays):
+        values = np.concatenate([np.asarray(array, dtype=np.int64) for array in arrays])
+    else:
+        values = np.array([], dtype=np.int64)
+    return offsets, values
+
+
 class TVBInterface(HasTraits):
     __metaclass__ = ABCMeta
 
     """TVBInterface base class for interfaces sending/receivng data from/for TVB to/from a transformer of cosimulator"""
 
     proxy_inds = NArray(
-        dtype=np.int,
+        dtype=np.intp,
         label="Indices of TVB proxy nodes",
         doc="""Indices of TVB proxy nodes""",
         required=True,
     )
 
     voi = NArray(
-        dtype=int,
+        dtype=np.intp,
         label="Cosimulation model state variables' indices",
         doc="""Indices of model's variables of interest (VOI)""",
         required=True)
 
-    voi_loc = np.array([])
+    voi_loc = np.array([], dtype=np.intp)
 
     voi_labels = NArray(
         dtype='U128',
@@ -43,10 +98,23 @@ class TVBInterface(HasTraits):
         required=True,
     )
 
+    _proxy_inds_intervals = None  # Cached (proxy_inds, integer intervals of proxy_inds)
+
+    def configure(self):
+        self._proxy_inds_intervals = None
+        super(TVBInterface, self).configure()
+
+    def _get_proxy_inds_intervals(self):
+        """Method to get the integer intervals of proxy_inds, computed once,
+           and cached until configure() is called or proxy_inds is set to another array."""
+        if self._proxy_inds_intervals is None or self._proxy_inds_intervals[0] is not self.proxy_inds:
+            self._proxy_inds_intervals = (self.proxy_inds, extract_integer_intervals(self.proxy_inds))
+        return self._proxy_inds_intervals[1]
+
     @property
     def label(self):
         return "%s: %s (%s)" % (self.__class__.__name__, str(self.voi_labels),
-                                extract_integer_intervals(self.proxy_inds))
+                                self._get_proxy_inds_intervals())
 
     @property
     def number_of_proxy_nodes(self):
@@ -56,13 +124,24 @@ class TVBInterface(HasTraits):
     def n_voi(self):
         return self.voi.shape[0]
 
-    def _set_local_indices(self, inds, simulator_inds):
-        simulator_inds_list = list(simulator_inds)
-        return np.array([simulator_inds_list.index(ind) for ind in inds])
-
-    def set_local_voi_indices(self, monitor_voi):
+    def _set_local_indices(self, inds, simulator_inds, simulator_inds_lookup=None):
+        # Map each index to its (first) position in the simulator indices,
+        # via an inverse lookup table, which the containers may build once for all interfaces:
+        if simulator_inds_lookup is None:
+            simulator_inds_lookup = _build_inds_lookup(simulator_inds)
+        inds = np.asarray(inds, dtype=np.intp)
+        inds_loc = np.full(inds.shape, -1, dtype=np.intp)
+        in_range = (inds >= 0) & (inds < simulator_inds_lookup.shape[0])
+        inds_loc[in_range] = simulator_inds_lookup[inds[in_range]]
+        missing = inds_loc < 0
+        if np.any(missing):
+            raise ValueError("Index %s is not in the simulator indices %s!"
+                             % (str(inds[missing][0]), str(simulator_inds)))
+        return inds_loc
+
+    def set_local_voi_indices(self, monitor_voi, monitor_voi_lookup=None):
         """Method to set the correct voi indices with reference to the linked TVB CosimMonitor or CosimHistory"""
-        self.voi_loc = self._set_local_indices(self.voi, monitor_voi)
+        self.voi_loc = self._set_local_indices(self.voi, monitor_voi, monitor_voi_lookup)
 
     @abstractmethod
     def set_local_indices(self, *args):
@@ -98,19 +177,27 @@ class TVBOutputInterface(TVBInterface):
     @property
     def label(self):
         return "%s: %s (%s) ->" % (self.__class__.__name__, str(self.voi_labels),
-                                   extract_integer_intervals(self.proxy_inds))
+                                   self._get_proxy_inds_intervals())
 
-    def set_local_indices(self, monitor_voi):
-        self.set_local_voi_indices(monitor_voi)
+    _reshape_values = None  # Reshaping function of the data values, specialized to the number of local voi
+
+    def set_local_indices(self, monitor_voi, monitor_voi_lookup=None):
+        self.set_local_voi_indices(monitor_voi, monitor_voi_lookup)
+        # The number of voi of the data is fixed from now on,
+        # so that we can choose the reshaping of the data values once:
+        if self.voi_loc.shape[0] == 1:
+            self._reshape_values = _tvb_to_proxy_time
+        else:
+            self._reshape_values = _tvb_to_proxy_time_voi
 
     def __call__(self, data):
         # Assume a single mode, and reshape from TVB (time, voi, proxy)...
-        if data[1].shape[1] == 1:
-            # ...to (proxy, time)
-            data[1] = data[1][:, 0, :].T
+        if self._reshape_values is not None:
+            data[1] = self._reshape_values(data[1])
+        elif data[1].shape[1] == 1:
+            data[1] = _tvb_to_proxy_time(data[1])
         else:
-            # ...or (proxy, time, voi)
-            data[1] = np.transpose(data[1], (2, 0, 1))
+            data[1] = _tvb_to_proxy_time_voi(data[1])
         return data
 
 
@@ -118,16 +205,18 @@ class TVBInputInterface(TVBInterface):
 
     """TVBInputInterface base class for interfaces receiving data for TVB from a transformer or cosimulator"""
 
-    proxy_inds_loc = np.array([])
+    proxy_inds_loc = np.array([], dtype=np.intp)
 
     @property
     def label(self):
         return "%s: %s (%s) <-" % (self.__class__.__name__, str(self.voi_labels),
-                                   extract_integer_intervals(self.proxy_inds))
+                                   self._get_proxy_inds_intervals())
 
-    def set_local_indices(self, simulator_voi, simulator_proxy_inds):
-        self.set_local_voi_indices(simulator_voi)
-        self.proxy_inds_loc = self._set_local_indices(self.proxy_inds, simulator_proxy_inds)
+    def set_local_indices(self, simulator_voi, simulator_proxy_inds,
+                          simulator_voi_lookup=None, simulator_proxy_inds_lookup=None):
+        self.set_local_voi_indices(simulator_voi, simulator_voi_lookup)
+        self.proxy_inds_loc = self._set_local_indices(self.proxy_inds, simulator_proxy_inds,
+                                                      simulator_proxy_inds_lookup)
 
     def __call__(self, data):
         if data is None:
@@ -197,7 +286,7 @@ class TVBtoSpikeNetInterface(TVBOutputInterface, SpikeNetInputInterface, BaseInt
     @property
     def label(self):
         return "%s: %s (%s) -> %s (%s)" % (self.__class__.__name__, str(self.voi_labels),
-                                           extract_integer_intervals(self.proxy_inds),
+                                           self._get_proxy_inds_intervals(),
                                            str(self.populations), extract_integer_intervals(self.spiking_proxy_inds))
 
     def configure(self):
@@ -247,7 +336,7 @@ class SpikeNetToTVBInterface(TVBInputInterface, SpikeNetOutputInterface, BaseInt
     @property
     def label(self):
         return "%s: %s (%s) <- %s (%s)" % (self.__class__.__name__, str(self.voi_labels),
-                                           extract_integer_intervals(self.proxy_inds),
+                                           self._get_proxy_inds_intervals(),
                                            str(self.populations), extract_integer_intervals(self.spiking_proxy_inds))
 
     def reshape_data(self):
@@ -280,13 +369,53 @@ class TVBInterfaces(HasTraits):
 
     """SpikeNetInterfaces abstract base class"""
 
+    _indices_cache = None  # Cached ((interfaces, number of interfaces), {property name: value})
+
+    def _get_cached_indices(self, name, fun):
+        """Method to compute the value of a property of the interfaces' indices once,
+           and cache it until configure() is called, or the interfaces' list is replaced or changes length."""
+        key = (self.interfaces, len(self.interfaces))
+        if self._indices_cache is None or \
+                self._indices_cache[0][0] is not key[0] or self._indices_cache[0][1] != key[1]:
+            self._indices_cache = (key, {})
+        cache = self._indices_cache[1]
+        if name not in cache:
+            cache[name] = fun()
+            if isinstance(cache[name], np.ndarray):
+                cache[name].flags.writeable = False
+        return cache[name]
+
+    def _clear_cached_indices(self, *names):
+        """Method to clear the cached values of the given properties of the interfaces' indices."""
+        if self._indices_cache is not None:
+            for name in names:
+                self._indices_cache[1].pop(name, None)
+
+    def configure(self):
+        self._indices_cache = None
+        super(TVBInterfaces, self).configure()
+
+    def _concatenate_from_interfaces(self, attr):
+        if len(self.interfaces) == 0:
+            return np.array([], dtype=np.intp)
+        return np.concatenate([np.asarray(getattr(interface, attr), dtype=np.intp).ravel()
+                               for interface in self.interfaces])
+
+    @property
+    def _all_voi(self):
+        return self._get_cached_indices("voi", lambda: self._concatenate_from_interfaces("voi"))
+
+    @property
+    def _all_proxy(self):
+        return self._get_cached_indices("proxy_inds", lambda: self._concatenate_from_interfaces("proxy_inds"))
+
     @property
     def voi(self):
-        return self._loop_get_from_interfaces("voi")
+        return self._all_voi
 
     @property
     def voi_unique(self):
-        return np.unique(self._loop_get_from_interfaces("voi"))
+        return self._get_cached_indices("voi_unique", lambda: np.unique(self._all_voi))
 
     @property
     def voi_labels(self):
@@ -298,11 +427,11 @@ class TVBInterfaces(HasTraits):
 
     @property
     def proxy_inds(self):
-        return self._loop_get_from_interfaces("proxy_inds")
+        return self._all_proxy
 
     @property
     def proxy_inds_unique(self):
-        return np.unique(self._loop_get_from_interfaces("proxy_inds"))
+        return self._get_cached_indices("proxy_inds_unique", lambda: np.unique(self._all_proxy))
 
     @property
     def n_vois(self):
@@ -343,8 +472,12 @@ class TVBOutputInterfaces(BaseInterfaces, TVBInterfaces):
     def set_local_indices(self, cosim_monitors):
         """Method to set the correct voi indices with reference to the linked TVB CosimMonitor,
            for each cosimulation"""
+        monitors_voi_lookups = {}
         for interface in self.interfaces:
-            interface.set_local_indices(cosim_monitors[interface.monitor_ind].voi)
+            monitor_voi = cosim_monitors[interface.monitor_ind].voi
+            if interface.monitor_ind not in monitors_voi_lookups:
+                monitors_voi_lookups[interface.monitor_ind] = _build_inds_lookup(monitor_voi)
+            interface.set_local_indices(monitor_voi, monitors_voi_lookups[interface.monitor_ind])
 
     def _compute_interface_times(self, interface, data):
         times = np.array([np.round(data[interface.monitor_ind][0][0] / self.dt),  # start_time_step
@@ -353,11 +486,32 @@ class TVBOutputInterfaces(BaseInterfaces, TVBInterfaces):
             times += self.synchronization_n_step  # adding the synchronization time when not a coupling interface
         return times
 
+    def _group_by_monitor(self):
+        """Method to group the interfaces by the monitor they get data from.
+           Returns:
+            a dictionary of the union of the proxy_inds of the interfaces of each monitor_ind,
+            and a list of the indices of each interface's proxy_inds into the union of its monitor.
+        """
+        monitors_proxy_inds = {}
+        for interface in self.interfaces:
+            monitors_proxy_inds[interface.monitor_ind] = \
+                np.union1d(monitors_proxy_inds.get(interface.monitor_ind, np.array([], dtype=np.intp)),
+                           interface.proxy_inds).astype(np.intp)
+        proxy_inds_loc = [np.searchsorted(monitors_proxy_inds[interface.monitor_ind], interface.proxy_inds)
+                          for interface in self.interfaces]
+        return monitors_proxy_inds, proxy_inds_loc
+
     def __call__(self, data):
+        monitors_proxy_inds, proxy_inds_loc = self._get_cached_indices("by_monitor", self._group_by_monitor)
+        # Gather the proxy nodes of all interfaces of each monitor at once,
+        # from the view of the single mode !!! assuming only 1 mode!!!:
+        monitors_data = dict((monitor_ind, np.take(data[monitor_ind][1][:, :, :, 0], proxy_inds, axis=2))
+                             for monitor_ind, proxy_inds in monitors_proxy_inds.items())
         for ii, interface in enumerate(self.interfaces):
-            #                 data values !!! assuming only 1 mode!!! -> shape (times, vois, proxys):
+            #                 data values -> shape (times, vois, proxys):
             interface([self._compute_interface_times(interface, data),
-                       data[interface.monitor_ind][1][:, interface.voi_loc][:, :, interface.proxy_inds, 0],
+                       np.take(np.take(monitors_data[interface.monitor_ind], proxy_inds_loc[ii], axis=2),
+                               interface.voi_loc, axis=1),
                        ii])
 
     def info(self, recursive=0):
@@ -376,52 +530,85 @@ class TVBInputInterfaces(BaseInterfaces, TVBInterfaces):
     """TVBInputInterfaces class holds a list of TVB interfaces from transformer/cosimulator
        and receives data from them"""
 
+    _time_steps_range = np.array([], dtype=np.int32)  # Cached range of time steps offsets
+
+    _cosim_updates = None  # Reused buffer of the cosimulation updates
+
+    def _pack_local_indices(self):
+        # Packed (offsets, values) arrays of the local voi and proxy indices of all interfaces:
+        return _pack_arrays([interface.voi_loc for interface in self.interfaces]) + \
+               _pack_arrays([interface.proxy_inds_loc for interface in self.interfaces])
+
+    def _get_packed_local_indices(self):
+        # The packed local indices are cached together with the rest of the interfaces' indices,
+        # and cleared whenever the local indices are set again:
+        return self._get_cached_indices("local_indices_packed", self._pack_local_indices)
+
+    @staticmethod
+    def _build_lookup(simulator_voi, simulator_proxy_inds):
+        return _build_inds_lookup(simulator_voi), _build_inds_lookup(simulator_proxy_inds)
+
     def set_local_indices(self, simulator_voi, simulator_proxy_inds):
         """Method to get the correct indices of voi and proxy_inds,
            adjusted to the contents, shape etc of the cosim_updates,
            based on TVB CoSimulators' vois and proxy_inds,
            for each cosimulation"""
+        simulator_voi_lookup, simulator_proxy_inds_lookup = self._build_lookup(simulator_voi, simulator_proxy_inds)
         for interface in self.interfaces:
-            interface.set_local_indices(simulator_voi, simulator_proxy_inds)
+            interface.set_local_indices(simulator_voi, simulator_proxy_inds,
+                                        simulator_voi_lookup, simulator_proxy_inds_lookup)
+        self._clear_cached_indices("local_indices_packed")
 
-    def _set_data_from_interface(self, cosim_updates, interface, data, good_cosim_update_values_shape):
+    def _get_time_steps(self, data):
         # Convert start and end input_time step to a vector of integer input_time steps:
-        time_steps = np.arange(data[0][0], data[0][1] + 1).astype("i")
-        cosim_updates[
-            (time_steps % good_cosim_update_values_shape[0])[:, None, None],
-            interface.voi_loc[None, :, None],  # indices specific to cosim_updates needed here
-            interface.proxy_inds_loc[None, None, :],  # indices specific to cosim_updates needed here
-            0] = np.copy(data[1])  # !!! assuming only 1 mode!!!
+        n_time_steps = data[0][1] - data[0][0] + 1
+        if self._time_steps_range.shape[0] < n_time_steps:
+            self._time_steps_range = np.arange(n_time_steps, dtype=np.int32)
+        return self._time_steps_range[:n_time_steps] + np.int32(data[0][0])
+
+    def _get_from_interfaces(self, cosim_updates):
+        # Receive the data of all interfaces...
+        i_interfaces = []
+        time_steps = []
+        values = []
+        for ii, interface in enumerate(self.interfaces):
+            data = interface()  # [start_and_time_steps, values]
+            if data is not None:
+                i_interfaces.append(ii)
+                time_steps.append(self._get_time_steps(data))
+                values.append(np.broadcast_to(np.asarray(data[1], dtype=cosim_updates.dtype),
+                                              (time_steps[-1].shape[0],
+                                               len(interface.voi_loc),
+                                               len(interface.proxy_inds_loc))).ravel())
+        if len(i_interfaces) == 0:
+            return cosim_updates, []
+        # ...and scatter them to the cosim_updates, with a single call of a compiled loop,
+        # using the indices specific to cosim_updates (!!! assuming only 1 mode!!!):
+        time_steps_offsets, time_steps = _pack_arrays(time_steps)
+        _scatter_cosim_updates(cosim_updates, np.array(i_interfaces, dtype=np.int64),
+                               time_steps, time_steps_offsets, np.concatenate(values),
+                               *self._get_packed_local_indices())
         return cosim_updates, time_steps
 
-    def _get_from_interface(self, interface, cosim_updates, all_time_steps, good_cosim_update_values_shape):
-        data = interface()  # [start_and_time_steps, values]
-        if data is not None:
-            cosim_updates, time_steps = \
-                self._set_data_from_interface(cosim_updates, interface, data, good_cosim_update_values_shape)
-            all_time_steps += time_steps.tolist()
-            return cosim_updates, all_time_steps
-        else:
-            return cosim_updates, all_time_steps
-
     def _prepare_cosim_upadate(self, good_cosim_update_values_shape):
-        cosim_updates = np.empty(good_cosim_update_values_shape).astype(float)
-        cosim_updates[:] = np.NAN
+        # Allocate the cosim_updates buffer only once, and just reset it to NaN for every call:
+        if self._cosim_updates is None or self._cosim_updates.shape != tuple(good_cosim_update_values_shape):
+            self._cosim_updates = np.empty(good_cosim_update_values_shape, dtype=float)
+        self._cosim_updates.fill(np.nan)
         all_time_steps = []
-        return cosim_updates, all_time_steps
+        return self._cosim_updates, all_time_steps
 
     def get_inputs(self, cosim_updates, all_time_steps, good_cosim_update_values_shape):
         if len(all_time_steps):
             all_time_steps = np.unique(all_time_steps)
+            # Fancy indexing returns a copy, independent of the reused cosim_updates buffer:
             return [all_time_steps, cosim_updates[all_time_steps % good_cosim_update_values_shape[0]]]
         else:
-            return [all_time_steps, cosim_updates]
+            return [all_time_steps, cosim_updates.copy()]
 
     def __call__(self, good_cosim_update_values_shape):
         cosim_updates, all_time_steps = self._prepare_cosim_upadate(good_cosim_update_values_shape)
-        for interface in self.interfaces:
-            cosim_updates, all_time_steps = \
-                self._get_from_interface(interface, cosim_updates, all_time_steps, good_cosim_update_values_shape)
+        cosim_updates, all_time_steps = self._get_from_interfaces(cosim_updates)
         return self.get_inputs(cosim_updates, all_time_steps, good_cosim_update_values_shape)
 
     def info(self, recursive=0):
@@ -286,7 +286,7 @@ class SpikingNetworkBuilder(object):
         for pop_name, scale in sizes.items():
             if isinstance(scale, dict):
                 for node_key, node_scale in scale.items():
-                    sizes[pop_name][node_key] = int(np.round(sizes[pop_name][node_key] * self.population_order))
+                    sizes[pop_name][node_key] = int(round(sizes[pop_name][node_key] * self.population_order))
             else:
                 sizes[pop_name] *= self.population_order
         return sizes
@@ -418,7 +418,7 @@ class SpikingNetworkBuilder(object):
 
     def update_spiking_dt(self):
         # The TVB dt should be an integer multiple of the spiking simulator dt:
-        self.spiking_dt = int(np.round(self.tvb_dt / self.tvb_to_spiking_dt_ratio / self.default_min_spiking_dt)) \
+        self.spiking_dt = int(round(self.tvb_dt / self.tvb_to_spiking_dt_ratio / self.default_min_spiking_dt)) \
                           * self.default_min_spiking_dt
 
     def update_default_min_delay(self):
@@ -610,7 +610,7 @@ class SpikingNetworkBuilder(object):
                 if node_id in population["nodes"]:
                     LOG.info("Generating population: %s..." % population["label"])
                     # ...generate this population in this node...
-                    size = int(np.round(population["scale"](node_id) * self.population_order))
+                    size = int(round(population["scale"](node_id) * self.population_order))
                     self._spiking_brain[node_label][population["label"]] = \
                         self.build_spiking_population(population["label"], population["model"], node_label, size,
                                                       params=population["params"](node_id),
@@ -2,11 +2,12 @@
 from abc import ABCMeta, abstractmethod
 import uuid
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
 from tvb.basic.neotraits.api import Attr
-from tvb.contrib.scripts.utils.data_structures_utils import list_of_dicts_to_dicts_of_ndarrays
+from tvb.contrib.scripts.utils.data_structures_utils import ensure_list, list_of_dicts_to_dicts_of_ndarrays
 
 from tvb_multiscale.core.config import initialize_logger
 from tvb_multiscale.core.neotraits import HasTraits
@@ -16,6 +17,33 @@ from tvb_multiscale.core.utils.data_structures_utils import summarize, extract_i
 LOG = initialize_logger(__name__)
 
 
+# Integer codes of the directions of connections relative to the nodes,
+# to which the source_or_target strings of the public API are converted once:
+SOURCE, TARGET, SOURCE_AND_TARGET = 0, 1, 2
+SOURCE_OR_TARGET_CODES = {"source": SOURCE, "target": TARGET, None: SOURCE_AND_TARGET}
+
+
+def source_or_target_code(source_or_target):
+    """Function to convert a source_or_target direction of connections ("source", "target" or None)
+       to its integer code (SOURCE, TARGET, or SOURCE_AND_TARGET respectively)."""
+    if isinstance(source_or_target, str):
+        source_or_target = source_or_target.lower()
+    try:
+        return SOURCE_OR_TARGET_CODES[source_or_target]
+    except KeyError:
+        raise ValueError("source_or_target = %s is not one of 'source', 'target' or None!" % str(source_or_target))
+
+
+_IO_POOL = None  # Two-worker thread pool, created on first use, to query source and target connections in parallel
+
+
+def _get_io_pool():
+    global _IO_POOL
+    if _IO_POOL is None:
+        _IO_POOL = ThreadPoolExecutor(max_workers=2)
+    return _IO_POOL
+
+
 class SpikingNodeCollection(HasTraits):
     __metaclass__ = ABCMeta
 
@@ -28,6 +56,32 @@ class SpikingNodeCollection(HasTraits):
 
     _nodes = None  # Class instance of a sequence of nodes, that depends on its spiking simulator
 
+    # Set to True for spiking simulators that can be queried concurrently from several threads,
+    # releasing the GIL, so that source and target connections are queried in parallel:
+    _parallel_io = False
+
+    _cache_gids = True  # Set to False for nodes the elements of which may change without _nodes changing
+    _gids = None  # Cached read-only contiguous array of the gids of the nodes' elements
+    _gids_nodes = None  # The _nodes instance for which the cached _gids have been computed
+    _gids_to_local = None  # Cached (gids, lookup table) from gids to local indices of the nodes' elements
+    _size = None  # Cached number of the nodes' elements
+    _size_nodes = None  # The _nodes instance for which the cached _size has been computed
+
+    _str_cache = None  # Cached (key, string) of the summary string representation
+
+    # Set to True for nodes the attributes, connections and connections' attributes of which change
+    # only via Set() and SetToConnections(), i.e., not by the spiking simulator while simulating
+    # (e.g., plastic synapses), nor by connecting the nodes, nor by direct access to _nodes:
+    _cache_attributes = False
+    _attributes_soa = None  # Cached (_nodes, {attribute: values}) of all the attributes of all nodes
+    _attributes_cache = None  # Cached (_nodes, {summary: attributes}) of the attributes of all nodes
+
+    # Cached outputs of the connections, weights, delays and receptors properties, if _cache_attributes is True:
+    _connections = None
+    _weights = None
+    _delays = None
+    _receptors = None
+
     label = Attr(field_type=str, default="", required=True,
                  label="Node label", doc="""Label of SpikingNodeCollection""")
 
@@ -54,10 +108,11 @@ class SpikingNodeCollection(HasTraits):
                 brain_region: a string with the name of the brain_region where the node resides
         """
         self._nodes = nodes
-        self.label = str(kwargs.get("label", self.__class__.__name__))
-        self.model = str(kwargs.get("model", self.__class__.__name__))
-        self.brain_region = str(kwargs.get("brain_region", ""))
-        HasTraits.__init__(self)
+        # Let HasTraits.__init__ set and validate the traits once:
+        HasTraits.__init__(self,
+                           label=str(kwargs.get("label", self.__class__.__name__)),
+                           model=str(kwargs.get("model", self.__class__.__name__)),
+                           brain_region=str(kwargs.get("brain_region", "")))
         self.configure()
 
     def __getstate__(self):
@@ -84,8 +139,58 @@ class SpikingNodeCollection(HasTraits):
         self.title = d.get("title",
                            '{} gid: {}'.format(self.__class__.__name__, self.gid))
         self.tags = d.get("tags", {})
+        self._invalidate_caches()
         self.configure()
 
+    @classmethod
+    def from_bulk(cls, nodes_list, labels=None, models=None, brain_regions=None, **kwargs):
+        """Method to build many instances of this class at once,
+           by restoring each instance's state via __setstate__, as unpickling does,
+           instead of running the chain of constructors, and HasTraits.__init__, per instance.
+           Arguments:
+            nodes_list: sequence of class instances of sequences of spiking network elements.
+            labels: a string, or a sequence of strings, with the labels of the nodes.
+                    Default = None, corresponding to the name of this class.
+            models: a string, or a sequence of strings, with the names of the models of the nodes.
+                    Default = None, corresponding to the name of this class.
+            brain_regions: a string, or a sequence of strings,
+                           with the names of the brain regions where the nodes reside. Default = None, i.e., "".
+            **kwargs: any other state common to all instances, that the __setstate__ of this class restores,
+                      e.g., the spiking simulator instance.
+           Returns:
+            list of instances of this class.
+        """
+        n_nodes = len(nodes_list)
+
+        def bulk_values(values, default):
+            if values is None:
+                values = default
+            if isinstance(values, str):
+                return [values] * n_nodes
+            values = list(values)
+            if len(values) != n_nodes:
+                raise ValueError("%d values %s given for %d nodes!" % (len(values), str(values), n_nodes))
+            return values
+
+        objs = []
+        for nodes, label, model, brain_region in zip(nodes_list,
+                                                     bulk_values(labels, cls.__name__),
+                                                     bulk_values(models, cls.__name__),
+                                                     bulk_values(brain_regions, "")):
+            state = dict(kwargs)
+            state.update({"_nodes": nodes,
+                          "label": str(label),
+                          "model": str(model),
+                          "brain_region": str(brain_region),
+                          "_weight_attr": cls._weight_attr,
+                          "_delay_attr": cls._delay_attr,
+                          "_receptor_attr": cls._receptor_attr,
+                          "gid": uuid.uuid4()})
+            obj = cls.__new__(cls)
+            obj.__setstate__(state)
+            objs.append(obj)
+        return objs
+
     def __getitem__(self, keys):
         """Slice specific nodes (keys) of this SpikingNodeCollection.
            Argument:
@@ -114,12 +219,100 @@ class SpikingNodeCollection(HasTraits):
         """Method to assert that the node of the network is valid"""
         pass
 
-    @property
     @abstractmethod
-    def gids(self):
+    def _get_gids(self):
         """Method to get a sequence (list, tuple, array) of the individual gids of nodes's elements"""
         pass
 
+    def _invalidate_attributes_caches(self):
+        """Method to clear all cached quantities that depend on the nodes' attributes."""
+        self._str_cache = None
+        self._attributes_soa = None
+        self._attributes_cache = None
+        self.refresh()
+
+    def refresh(self):
+        """Method to clear the cached outputs of the connections, weights, delays and receptors properties,
+           so that they are recomputed on their next access,
+           e.g., after new connections have been made from/to the nodes."""
+        self._connections = None
+        self._weights = None
+        self._delays = None
+        self._receptors = None
+
+    def _invalidate_caches(self):
+        """Method to clear all cached quantities that depend on the nodes."""
+        self._gids = None
+        self._gids_nodes = None
+        self._gids_to_local = None
+        self._size = None
+        self._size_nodes = None
+        self._invalidate_attributes_caches()
+
+    @property
+    def gids(self):
+        """Method to get an array of the individual gids of nodes's elements.
+           The array is computed once and cached, for as long as the _nodes instance remains the same,
+           and it is read-only, since it is shared by all callers."""
+        if not self._cache_gids:
+            return self._get_gids()
+        if self._gids is None or self._gids_nodes is not self._nodes:
+            self._gids = np.array(self._get_gids(), dtype=np.int64)
+            self._gids.flags.writeable = False
+            self._gids_nodes = self._nodes
+        return self._gids
+
+    def _get_gids_to_local(self):
+        """Method to get a lookup table from the gids to the local indices of nodes's elements.
+           It is a direct-address array, indexed by gid, with -1 for gids not in the collection,
+           unless the gids are too sparse, in which case it is a dictionary.
+           It is computed once and cached, for as long as the gids remain the same."""
+        gids = self.gids
+        if self._gids_to_local is None or self._gids_to_local[0] is not gids:
+            gids_array = np.asarray(gids, dtype=np.int64)
+            if gids_array.size and gids_array.min() >= 0 and gids_array.max() < 4 * gids_array.size + 1024:
+                table = np.full((gids_array.max() + 1, ), -1, dtype=np.int64)
+                table[gids_array] = np.arange(gids_array.size)
+            else:
+                table = dict(zip(gids_array.tolist(), range(gids_array.size)))
+            self._gids_to_local = (gids, table)
+        return self._gids_to_local[1]
+
+    def get_local_inds(self, gids):
+        """Method to get the local indices of nodes's elements, given their gids.
+           Arguments:
+            gids: a gid or a sequence (list, tuple, array) of gids of nodes's elements.
+           Returns:
+            the local index or an array of local indices of the respective elements.
+        """
+        table = self._get_gids_to_local()
+        gids_array = np.asarray(gids, dtype=np.int64)
+        if isinstance(table, dict):
+            inds = np.array([table.get(gid, -1) for gid in gids_array.ravel().tolist()],
+                            dtype=np.int64).reshape(gids_array.shape)
+        else:
+            inds = np.full(gids_array.shape, -1, dtype=np.int64)
+            valid = (gids_array >= 0) & (gids_array < table.size)
+            inds[valid] = table[gids_array[valid]]
+        if np.any(inds < 0):
+            raise ValueError("Gids %s are not elements of %s!"
+                             % (str(gids_array[inds < 0].tolist()), self.__class__.__name__))
+        if inds.ndim == 0:
+            return int(inds)
+        return inds
+
+    def get_nodes_by_gids(self, gids):
+        """Method to slice the elements of this SpikingNodeCollection, given their gids.
+           Argument:
+            gids: a gid or a sequence (list, tuple, array) of gids of nodes's elements.
+           Returns:
+            Sub-collection of SpikingNodeCollection nodes.
+        """
+        inds = self.get_local_inds(gids)
+        if isinstance(inds, np.ndarray):
+            inds = inds.tolist()
+        return self[inds]
+
     @property
     def nodes(self):
         return self._nodes
@@ -137,6 +330,15 @@ class SpikingNodeCollection(HasTraits):
         """
         pass
 
+    def _SetScalar(self, attr, value):
+        """Method to set a single attribute of all the SpikingNodeCollection's nodes to the same scalar value.
+           Backends that can do this faster than the generic _Set should override this method.
+           Arguments:
+            attr: the name of the attribute.
+            value: the scalar value of the attribute.
+        """
+        self._Set({attr: value})
+
     @abstractmethod
     def _Get(self, attr=None, nodes=None):
         """Method to get attributes of the SpikingNodeCollection's nodes.
@@ -165,6 +367,34 @@ class SpikingNodeCollection(HasTraits):
         """
         pass
 
+    def _GetConnectionsBatch(self, nodes=None, directions=("source", "target")):
+        """Method to get the connections from/to a SpikingNodeCollection node for several directions at once.
+           Backends that can fetch all directions in a single request should override this method,
+           but only for classes that do not override GetConnections.
+           Arguments:
+            nodes: instance of a nodes class,
+                   or sequence (list, tuple, array) of nodes the attributes of which should be set.
+                   Default = None, corresponds to all nodes.
+            directions: sequence of directions of connections relative to nodes ("source" and/or "target").
+                        Default = ("source", "target")
+           Returns:
+            tuple of connections' objects, one per direction.
+        """
+        # Go through the public GetConnections, so that the overrides of subclasses (e.g., devices
+        # connected in a single direction) apply, as for a single direction:
+        return tuple(self.GetConnections(nodes=nodes, source_or_target=source_or_target)
+                     for source_or_target in directions)
+
+    def _map_directions(self, fun, *iterables):
+        """Method to apply fun to the elements of iterables (e.g., connections) of each direction,
+           in parallel threads if _parallel_io is True, or sequentially otherwise.
+           Returns:
+            list of the outputs of fun for each direction.
+        """
+        if self._parallel_io:
+            return list(_get_io_pool().map(fun, *iterables))
+        return list(map(fun, *iterables))
+
     @abstractmethod
     def _SetToConnections(self, values_dict, connections=None):
         """Method to set attributes of the connections from/to the SpikingNodeCollection's nodes.
@@ -194,10 +424,16 @@ class SpikingNodeCollection(HasTraits):
             Returns:
                 int: number of nodes.
         """
-        if self._nodes:
-            return len(self._nodes)
-        else:
-            return 0
+        if self._cache_gids and self._size is not None and self._size_nodes is self._nodes:
+            return self._size
+        try:
+            size = len(self._nodes)
+        except TypeError:
+            size = 0
+        if self._cache_gids:
+            self._size = size
+            self._size_nodes = self._nodes
+        return size
 
     @property
     def size(self):
@@ -211,7 +447,30 @@ class SpikingNodeCollection(HasTraits):
                      or sequence (list, tuple, array) of nodes the attributes of which should be set.
                      Default = None, corresponds to all nodes.
         """
+        if nodes is None and len(values_dict) == 1:
+            attr, value = next(iter(values_dict.items()))
+            if np.isscalar(value):
+                # Fast path for setting a single attribute of all nodes to the same scalar value:
+                self._SetScalar(attr, value)
+                self._invalidate_attributes_caches()
+                return
         self._Set(values_dict, nodes)
+        self._invalidate_attributes_caches()
+
+    def _get_attributes_soa(self):
+        """Method to get all the attributes of all the SpikingNodeCollection's nodes,
+           as a dictionary of one sequence (list, tuple, or read-only array) per attribute,
+           which is computed once and cached, until the nodes or their attributes change.
+        """
+        if self._attributes_soa is None or self._attributes_soa[0] is not self._nodes:
+            attributes = self._Get()
+            if isinstance(attributes, (tuple, list)):
+                attributes = list_of_dicts_to_dicts_of_ndarrays(attributes)
+            for val in attributes.values():
+                if isinstance(val, np.ndarray):
+                    val.flags.writeable = False
+            self._attributes_soa = (self._nodes, attributes)
+        return self._attributes_soa[1]
 
     def Get(self, attrs=None, nodes=None, summary=None):
         """Method to get attributes of the SpikingNodeCollection's nodes.
@@ -229,9 +488,18 @@ class SpikingNodeCollection(HasTraits):
            Returns:
             Dictionary of sequences (lists, tuples, or arrays) of nodes' attributes.
         """
-        attributes = self._Get(attrs, nodes)
-        if isinstance(attributes, (tuple, list)):
-            attributes = list_of_dicts_to_dicts_of_ndarrays(attributes)
+        attributes = None
+        if nodes is None and self._cache_attributes:
+            # Serve the attributes of all nodes from the cached sequences, without copying them:
+            soa = self._get_attributes_soa()
+            if attrs is None:
+                attributes = dict(soa)
+            elif all(attr in soa for attr in ensure_list(attrs)):
+                attributes = {attr: soa[attr] for attr in ensure_list(attrs)}
+        if attributes is None:
+            attributes = self._Get(attrs, nodes)
+            if isinstance(attributes, (tuple, list)):
+                attributes = list_of_dicts_to_dicts_of_ndarrays(attributes)
         if summary:
             return summarize(attributes, summary)
         else:
@@ -251,8 +519,17 @@ class SpikingNodeCollection(HasTraits):
                      Default = None, corresponds to returning all values
            Returns:
             Dictionary of sequences (lists, tuples, or arrays) of nodes' attributes.
+            If _cache_attributes is True, the attributes of all nodes are cached per summary,
+            until the nodes or their attributes change.
         """
-        return self.Get(nodes=nodes, summary=summary)
+        if nodes is not None or not self._cache_attributes:
+            return self.Get(nodes=nodes, summary=summary)
+        if self._attributes_cache is None or self._attributes_cache[0] is not self._nodes:
+            self._attributes_cache = (self._nodes, {})
+        attributes = self._attributes_cache[1]
+        if summary not in attributes:
+            attributes[summary] = self.Get(summary=summary)
+        return attributes[summary]
 
     def GetConnections(self, nodes=None,  source_or_target=None):
         """Method to get all connections of the device to/from nodes.
@@ -279,13 +556,15 @@ class SpikingNodeCollection(HasTraits):
         """
         if connections is None:
             if source_or_target is None:
-                # In case we deal with both source and target connections, treat them separately:
-                for source_or_target in ["source", "target"]:
-                    self.SetToConnections(values_dict, nodes, source_or_target)
-            else:
-                connections = self.GetConnections(nodes, source_or_target)
-                self._SetToConnections(values_dict, connections)
+                # In case we deal with both source and target connections, treat them separately,
+                # getting each direction's connections only once:
+                for connections in self._GetConnectionsBatch(nodes):
+                    self._SetToConnections(values_dict, connections)
+                self._invalidate_attributes_caches()
+                return
+            connections = self.GetConnections(nodes, source_or_target)
         self._SetToConnections(values_dict, connections)
+        self._invalidate_attributes_caches()
 
     def GetFromConnections(self, attrs=None, nodes=None, source_or_target=None, connections=None, summary=None):
         """Method to get attributes of the connections from/to the SpikingNodeCollection's nodes.
@@ -311,11 +590,11 @@ class SpikingNodeCollection(HasTraits):
         """
         if connections is None:
             if source_or_target is None:
-                # In case we deal with both source and target connections, treat them separately:
-                output = []
-                for source_or_target in ["source", "target"]:
-                    output.append(self.GetFromConnections(attrs=attrs, nodes=nodes,
-                                                          source_or_target=source_or_target, summary=summary))
+                # In case we deal with both source and target connections, treat them separately,
+                # after getting the connections of both directions in one batch:
+                output = self._map_directions(
+                    lambda connections: self.GetFromConnections(attrs=attrs, connections=connections, summary=summary),
+                    self._GetConnectionsBatch(nodes))
                 if len(output) == 0:
                     return {}
                 if len(output) == 1:
@@ -353,11 +632,9 @@ class SpikingNodeCollection(HasTraits):
         if connections is None:
             if source_or_target is None:
                 # In case we deal with both source and target connections, treat them separately:
-                outputs = []
-                for source_or_target in ["source", "target"]:
-                    outputs.append(self._get_connection_attribute(attr, nodes=nodes, source_or_target=source_or_target,
-                                                                  summary=summary))
-                return tuple(outputs)
+                return tuple(self._map_directions(
+                    lambda connections: self._get_connection_attribute(attr, connections=connections, summary=summary),
+                    self._GetConnectionsBatch(nodes)))
             return self.GetFromConnections(attr, nodes=nodes, source_or_target=source_or_target,
                                            summary=summary).get(attr, [])
         else:
@@ -384,26 +661,32 @@ class SpikingNodeCollection(HasTraits):
                 """
         if connections is None:
             if source_or_target is None:
-                # In case we deal with both source and target connections, treat them separately:
-                outputs = []
-                for source_or_target in ["source", "target"]:
-                    outputs.append(self.get_connected_nodes(nodes=nodes, source_or_target=source_or_target,
-                                                            ummary=summary))
-                return tuple(outputs)
+                # In case we deal with both source and target connections, treat them separately,
+                # after getting the connections of both directions in one batch.
+                # For the connections the nodes are the source of, we return their targets, and vice versa:
+                return tuple(self._map_directions(
+                    lambda attr, connections: self.GetFromConnections(attr, connections=connections,
+                                                                      summary=summary).get(attr, []),
+                    [self._target_conns_attr, self._source_conns_attr], self._GetConnectionsBatch(nodes)))
             # In this case the connections are found based on source_or_target,
             # and we need to reverse source_or_target to determines the nodes to return:
-            if source_or_target == "target":
-                attr = self._source_conns_attr
-            else:
-                attr = self._target_conns_attr
+            attr = self._get_conns_attr(1 - source_or_target_code(source_or_target))
             return self.GetFromConnections(attr, nodes=nodes, source_or_target=source_or_target,
                                            summary=summary).get(attr, [])
         else:
             # In this case the connections have already been found,
             # and the source_or_target determines if we want the sources or targets of those connections.
-            attr = getattr(self, "_%s_conns_attr" % source_or_target)
+            attr = self._get_conns_attr(source_or_target_code(source_or_target))
             return self.GetFromConnections(attr, connections=connections, summary=summary).get(attr, [])
 
+    def _get_conns_attr(self, code):
+        """Method to get the name of the connections' attribute of their sources (code=SOURCE) or targets (TARGET)."""
+        if code == SOURCE:
+            return self._source_conns_attr
+        if code == TARGET:
+            return self._target_conns_attr
+        raise ValueError("A single direction of connections is required, not source_or_target code %s!" % str(code))
+
     def get_weights(self, nodes=None, source_or_target=None, connections=None, summary=None):
         """Method to get the connections' weights of the SpikingNodeCollections's nodes.
            Arguments:
@@ -487,32 +770,56 @@ class SpikingNodeCollection(HasTraits):
         """Method to get the connections of the SpikingNodeCollection's nodes.
            Returns:
             connections' objects.
+           If _cache_attributes is True, the output is computed once and cached,
+           until refresh() is called, or the connections' attributes are set.
         """
-        return self.GetConnections()
+        if not self._cache_attributes:
+            return self.GetConnections()
+        if self._connections is None:
+            self._connections = self.GetConnections()
+        return self._connections
 
     @property
     def weights(self):
         """Method to get the connections' weights' statistical summary of the SpikingNodeCollections's nodes.
            Returns:
             Dictionary of sequences (lists, tuples, or arrays) of nodes's connections' weights.
+           If _cache_attributes is True, the output is computed once and cached,
+           until refresh() is called, or the connections' attributes are set.
         """
-        return self.get_weights()
+        if not self._cache_attributes:
+            return self.get_weights()
+        if self._weights is None:
+            self._weights = self.get_weights()
+        return self._weights
 
     @property
     def delays(self):
         """Method to get the connections' delays of the SpikingNodeCollections's nodes.
            Returns:
             Dictionary of sequences (lists, tuples, or arrays) of nodes's connections' delays.
+           If _cache_attributes is True, the output is computed once and cached,
+           until refresh() is called, or the connections' attributes are set.
         """
-        return self.get_delays()
+        if not self._cache_attributes:
+            return self.get_delays()
+        if self._delays is None:
+            self._delays = self.get_delays()
+        return self._delays
 
     @property
     def receptors(self):
         """Method to get the connections' receptors of the SpikingNodeCollections's nodes.
            Returns:
             Dictionary of sequences (lists, tuples, or arrays) of nodes's connections' receptors.
+           If _cache_attributes is True, the output is computed once and cached,
+           until refresh() is called, or the connections' attributes are set.
         """
-        return self.get_receptors()
+        if not self._cache_attributes:
+            return self.get_receptors()
+        if self._receptors is None:
+            self._receptors = self.get_receptors()
+        return self._receptors
 
     def info_nodes(self):
         info = OrderedDict()
@@ -524,18 +831,13 @@ class SpikingNodeCollection(HasTraits):
         return {"gids": np.array(self.gids)}
 
     def _info_connectivity(self, source_or_target, attributes=True):
-        source_or_target = source_or_target.lower()
+        code = source_or_target_code(source_or_target)
         info = OrderedDict()
-        conns = self.GetConnections(source_or_target=source_or_target)
-        if source_or_target == "target":
-            source_or_target = "in"
-            source_or_target_reverse = "source"
-        else:
-            source_or_target = "out"
-            source_or_target_reverse = "target"
+        conns = self.GetConnections(source_or_target=source_or_target.lower())
+        source_or_target = ("out", "in")[code]
         if attributes:
             if attributes == True:
-                attributes = [getattr(self, "_%s_conns_attr" % source_or_target_reverse),
+                attributes = [self._get_conns_attr(1 - code),
                               self._weight_attr, self._delay_attr, self._receptor_attr]
             conn_attrs = self.GetFromConnections(attrs=attributes, connections=conns)
             for attr in attributes:
@@ -566,6 +868,20 @@ class SpikingNodeCollection(HasTraits):
         info.update(self.info_nodes())
         return info
 
+    def __str__(self):
+        # The summary string is cached, for as long as the nodes, their attributes, the title,
+        # and the objects assigned to the declarative attributes remain the same,
+        # unless the nodes' elements may change without _nodes changing:
+        if not self._cache_gids:
+            return super(SpikingNodeCollection, self).__str__()
+        key = (self._nodes, self.title) + \
+              tuple(getattr(self, attr, None) for attr in type(self).declarative_attrs)
+        if self._str_cache is None or \
+                len(key) != len(self._str_cache[0]) or \
+                any(obj is not cached for obj, cached in zip(key, self._str_cache[0])):
+            self._str_cache = (key, super(SpikingNodeCollection, self).__str__())
+        return self._str_cache[1]
+
     def info_details(self, recursive=0, connectivity=False, source_or_target=None):
         info = super(SpikingNodeCollection, self).info_details(recursive=recursive)
         info.update(self.info_nodes())
@@ -199,7 +199,9 @@ class ReducedWongWangExcIOInhI(TVBReducedWongWangExcInh):
         return state_variables
 
     def _integration_to_state_variables(self, integration_variables):
-        return numpy.array(integration_variables.tolist() + [0.0*integration_variables[0]] * self.n_nonintvar)
+        # Append zeros for the non integrated variables without a round trip through Python lists:
+        return numpy.concatenate([integration_variables,
+                                  numpy.zeros((self.n_nonintvar, ) + integration_variables.shape[1:])])
 
     def _numpy_dfun(self, integration_variables, R):
         r"""
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import warnings
 from inspect import stack
 from itertools import product
 from collections import OrderedDict
@@ -8,15 +9,15 @@ from enum import Enum
 import typing
 
 import numpy as np
-from scipy.stats import describe
 import pandas as pd
 from xarray import DataArray
+from numba import njit
 
 from tvb.basic.neotraits.api import HasTraits
 
 
 from tvb.contrib.scripts.utils.data_structures_utils import \
-    ensure_list, flatten_list, is_integer, extract_integer_intervals
+    ensure_list, flatten_list, is_integer
 
 
 def is_iterable(obj):
@@ -27,6 +28,48 @@ def is_iterable(obj):
         return False
 
 
+@njit(cache=True)
+def _integer_intervals(iterable):
+    # Scan the sorted unique integers once to count the intervals,
+    # and once more to fill their (start, end) pairs, without any temporary arrays:
+    n_intervals = 1
+    for ii in range(1, iterable.shape[0]):
+        if iterable[ii] - iterable[ii - 1] != 1:
+            n_intervals += 1
+    intervals = np.empty((n_intervals, 2), dtype=np.int64)
+    intervals[0, 0] = iterable[0]
+    i_interval = 0
+    for ii in range(1, iterable.shape[0]):
+        if iterable[ii] - iterable[ii - 1] != 1:
+            intervals[i_interval, 1] = iterable[ii - 1]
+            i_interval += 1
+            intervals[i_interval, 0] = iterable[ii]
+    intervals[i_interval, 1] = iterable[-1]
+    return intervals
+
+
+def extract_integer_intervals(iterable, as_string=False, print=None):
+    """Function to summarize a sequence of integers into a list of (start, end) intervals of consecutive integers.
+       The values are cast to int64, i.e., any non-integer values are truncated,
+       and sorted and unique-ified first, i.e., duplicate values are merged into the same interval.
+       The runs are found by a Numba compiled scan of the consecutive elements.
+       If as_string is True, the intervals are returned as a string, e.g., "(0, 3), (5, 5)".
+       The print argument is a deprecated alias of as_string, which shadows the builtin print.
+    """
+    if print is not None:
+        warnings.warn("The print argument of extract_integer_intervals is deprecated, use as_string instead!",
+                      DeprecationWarning, stacklevel=2)
+        as_string = print
+    iterable = np.unique(np.asarray(iterable, dtype=np.int64).ravel())
+    if iterable.size:
+        intervals = _integer_intervals(iterable).tolist()
+    else:
+        intervals = []
+    if as_string:
+        return ", ".join("(%d, %d)" % (start, end) for start, end in intervals)
+    return [tuple(interval) for interval in intervals]
+
+
 def get_caller_fun_name(caller_id=1):
     return str(stack()[caller_id][3])
 
@@ -164,7 +207,7 @@ def combine_enums(enum_name, *args):
 def summarize_value(value, digits=3):
 
     def unique(values, astype=None):
-        values = np.array(values)
+        values = np.asarray(values)
         if values.size:
             if astype is None:
                 astype = str(values.dtype)
@@ -186,27 +229,34 @@ def summarize_value(value, digits=3):
         return scale * unique(np.around(vals / scale, decimals=digits))
 
     def stats_fun(vals):
-        d = describe(vals)
+        # Compute only the statistics we need,
+        # instead of scipy.stats.describe, which also computes skewness and kurtosis:
         summary = OrderedDict()
-        # summary["n"] = d.nobs
-        summary["min"] = d.minmax[0]
+        # summary["n"] = vals.size
+        summary["min"] = np.min(vals, axis=0)
         summary["median"] = np.median(vals)
-        summary["max"] = d.minmax[1]
-        summary["mean"] = d.mean
-        summary["var"] = d.variance
+        summary["max"] = np.max(vals, axis=0)
+        summary["mean"] = np.mean(vals, axis=0)
+        summary["var"] = np.var(vals, axis=0, ddof=1)
         return summary
 
-    vals = ensure_list(value)
+    if isinstance(value, np.ndarray) and value.ndim > 0:
+        # Use arrays as they are, without boxing their elements into a list:
+        vals = value
+    else:
+        vals = ensure_list(value)
     n_vals = len(vals)
     try:
-        val_type = str(np.array(vals).dtype)
-        if np.all([isinstance(val, dict) for val in vals]):
+        # Convert the values to an array only once, without copying input arrays:
+        vals_array = np.asarray(vals)
+        val_type = str(vals_array.dtype)
+        if vals_array.dtype.kind == "O" and np.all([isinstance(val, dict) for val in vals]):
             # If they are all dicts:
-            return np.array(vals)
+            return vals_array
         else:
-            unique_vals = unique(vals, val_type)
+            unique_vals = unique(vals_array, val_type)
             if unique_vals.ndim > 1 and np.prod(unique_vals.shape[1:]) > 5:
-                return summarize_value(np.array(vals).flatten(), digits)
+                return summarize_value(vals_array.flatten(), digits)
             n_unique_vals = unique_vals.shape[0]
             if n_unique_vals < 2:
                 # If they are all of the same value, just set this value:
@@ -227,7 +277,7 @@ def summarize_value(value, digits=3):
                             n_temp_unique_vals = n_unique_vals
                         if n_temp_unique_vals > 5:
                             # ...or compute summary statistics
-                            return stats_fun(np.array(vals))
+                            return stats_fun(vals_array)
                         else:
                             unique_vals = temp_unique_vals
                             n_unique_vals = n_temp_unique_vals
@@ -237,7 +287,7 @@ def summarize_value(value, digits=3):
                 # If it is not a vector of floats, or there are (now) less than 5 values,
                 # return a summary dictionary with the indices of each value:
                 output = OrderedDict()
-                vals = np.array(vals)
+                vals = vals_array
                 if val_type[0] == 'f':
                     indices = OrderedDict()
                     for unique_val in unique_vals:
@@ -245,7 +295,7 @@ def summarize_value(value, digits=3):
                     for iV, val in enumerate(vals):
                         indices[unique_vals[np.argmin(np.abs(val - unique_vals))]].append(iV)
                     for unique_val, val_indices in indices.items():
-                        intervals = extract_integer_intervals(val_indices, print=True)
+                        intervals = extract_integer_intervals(val_indices, as_string=True)
                         if len(intervals) <= 50:
                             output["=%s" % str(unique_val)] = "{%s}" % intervals
                         else:
@@ -253,7 +303,7 @@ def summarize_value(value, digits=3):
                 else:
                     for unique_val in unique_vals:
                         indices = np.where(vals == unique_val)[0]
-                        intervals = extract_integer_intervals(indices, print=True)
+                        intervals = extract_integer_intervals(indices, as_string=True)
                         if len(intervals) <= 48:
                             output["=%s" % str(unique_val)] = "{%s}" % intervals
                         else:
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
 import os
+import mmap
+import pickle
 
-import dill  # , pickle  TODO: decide whether to use one or the other, or make it a configuration choice
+import dill
 from six import string_types
 
 import numpy as np
@@ -125,12 +127,63 @@ def read_nest_output_device_data_from_ascii_to_dict(filepath, n_lines_to_skip=0,
     #                                     empty_file=empty_file)
 
 
+PICKLE5_HEADER = b"TVBMULTISCALE_PICKLE5\n"
+
+
 def dump_pickled_dict(d, filepath):
+    """This function dumps a dictionary to a file.
+       It is serialized with dill, so that functions (e.g., defined in __main__ or in a notebook)
+       are serialized by value, using pickle protocol 5, if available (Python >= 3.8), so that the contiguous
+       numpy arrays' data are written out-of-band, i.e., as raw buffers after the pickled stream,
+       without being copied into it.
+       Arguments:
+        - d: the dictionary to be dumped.
+        - filepath: absolute or relative path to the file (string).
+    """
+    if pickle.HIGHEST_PROTOCOL < 5:
+        # Without protocol 5 (i.e., before Python 3.8), the arrays' data are pickled in-band:
+        with open(filepath, "wb") as f:
+            dill.dump(d, f)
+        return
+    buffers = []
+    data = dill.dumps(d, protocol=5, buffer_callback=buffers.append)
+    buffers = [buffer.raw() for buffer in buffers]
     with open(filepath, "wb") as f:
-        dill.dump(d, f)
+        f.write(PICKLE5_HEADER)
+        # The sizes of the pickled stream and of all buffers that follow it:
+        pickle.dump([len(data)] + [buffer.nbytes for buffer in buffers], f, protocol=5)
+        f.write(data)
+        for buffer in buffers:
+            f.write(buffer)
 
 
-def load_pickled_dict(filepath):
+def load_pickled_dict(filepath, mmap_mode=False):
+    """This function loads a dictionary from a file written by dump_pickled_dict, or by dill.
+       Arguments:
+        - filepath: absolute or relative path to the file (string).
+        - mmap_mode: if True, the out-of-band numpy arrays' data are not read into memory,
+                     but the arrays are read-only views of a memory map of the file. Default = False.
+       Returns:
+        the loaded dictionary
+    """
     with open(filepath, "rb") as f:
-        d = dill.load(f)
-    return d
\ No newline at end of file
+        if f.read(len(PICKLE5_HEADER)) != PICKLE5_HEADER:
+            f.seek(0)
+            return dill.load(f)
+        sizes = pickle.load(f)
+        data = f.read(sizes[0])
+        buffers = []
+        if mmap_mode:
+            offset = f.tell()
+            # The memory map remains open for as long as any array refers to it:
+            file_map = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            for size in sizes[1:]:
+                buffers.append(file_map[offset:offset+size])
+                offset += size
+        else:
+            for size in sizes[1:]:
+                # Read into writeable buffers, so that the loaded numpy arrays are writeable as well:
+                buffer = bytearray(size)
+                f.readinto(buffer)
+                buffers.append(buffer)
+    return dill.loads(data, buffers=buffers)
@@ -446,6 +446,8 @@ class ANNarchyOutputDevice(ANNarchyDevice):
 
     _data = None
 
+    _cache_gids = False  # Monitors may be added to the device without its _nodes changing
+
     monitors = Attr(field_type=dict, default=lambda: OrderedDict(), required=True,
                     label="Device's Monitors' dictionary",
                     doc="""A dictionary of the ANNarchy.Monitor instances of the ANNarchyOutputDevice""")
@@ -553,8 +555,7 @@ class ANNarchyOutputDevice(ANNarchyDevice):
     def Set(self, values_dict):
         self._Set(values_dict)
 
-    @property
-    def gids(self):
+    def _get_gids(self):
         return self.monitors_inds
 
     def _set_attributes_to_dict(self, dictionary, monitor, attribute):
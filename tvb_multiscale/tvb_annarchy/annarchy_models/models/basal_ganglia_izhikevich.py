@@ -106,7 +106,7 @@ class BasalGangliaIzhikevichBuilder(ANNarchyNetworkBuilder):
         ]
         self.population_sizes = OrderedDict()
         for pop in self.populations:
-            self.population_sizes[pop["label"]] = int(np.round(pop["scale"] * self.population_order))
+            self.population_sizes[pop["label"]] = int(round(pop["scale"] * self.population_order))
 
     def set_populations_connections(self):
         # Intra-regions'-nodes' connections
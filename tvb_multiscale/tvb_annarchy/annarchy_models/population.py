@@ -103,8 +103,7 @@ class _ANNarchyPopulation(HasTraits):
             self._population_ind = self._get_population_ind()
         return self._population_ind
 
-    @property
-    def gids(self):
+    def _get_gids(self):
         """Method to get a sequence (list, tuple, array) of the individual gids of nodes's elements"""
         return self._nodes.ranks
 
@@ -170,6 +169,15 @@ class _ANNarchyPopulation(HasTraits):
         """
         self._assert_nodes(neurons).set(values_dict)
 
+    def _SetScalar(self, attr, value):
+        """Method to set a single attribute of all the SpikingPopulation's neurons to the same scalar value,
+           by directly assigning it to the ANNarchy.Population.
+        Arguments:
+            attr: the name of the attribute.
+            value: the scalar value of the attribute.
+        """
+        setattr(self._nodes, attr, value)
+
     def _Get(self, attrs=None, neurons=None):
         """Method to get attributes of the SpikingPopulation's neurons.
            Arguments:
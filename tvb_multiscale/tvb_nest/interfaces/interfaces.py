@@ -51,9 +51,13 @@ class NESTOutputInterface(NESTInterface, SpikeNetOutputInterface):
                  field_type=NESTOutputDeviceSet,
                  required=True)
 
+    _biological_time = None  # NEST biological time, set by the NESTInterfaces for the step being sent
+
     @property
     def _time(self):
-        return self.nest_instance.GetKernelStatus("biological_time")
+        if self._biological_time is None:
+            return self.nest_instance.GetKernelStatus("biological_time")
+        return self._biological_time
 
     @property
     def proxy_gids(self):
@@ -151,12 +155,28 @@ class NESTInterfaces(HasTraits):
         else:
             return None
 
+    def _set_time(self, biological_time):
+        for interface in self.interfaces:
+            if isinstance(interface, NESTOutputInterface):
+                interface._biological_time = biological_time
+
+    def _call_at_current_time(self, fun, *args):
+        # Query the NEST kernel for the biological time once for all output interfaces of this step,
+        # and release it afterwards, so that the interfaces never use the time of a previous step:
+        if len(self.interfaces):
+            self._set_time(self.nest_instance.GetKernelStatus("biological_time"))
+        try:
+            return fun(self, *args)
+        finally:
+            self._set_time(None)
+
 
 class NESTOutputInterfaces(SpikeNetOutputRemoteInterfaces, NESTInterfaces):
 
     """NESTOutputInterfaces holding a list of NESTOutputInterface instances"""
 
-    pass
+    def __call__(self):
+        return self._call_at_current_time(SpikeNetOutputRemoteInterfaces.__call__)
 
 
 class NESTInputInterfaces(SpikeNetInputRemoteInterfaces, NESTInterfaces):
@@ -176,4 +196,5 @@ class TVBtoNESTInterfaces(TVBOutputInterfaces, NESTInputInterfaces):
 class NESTtoTVBInterfaces(TVBInputInterfaces, NESTOutputInterfaces):
     """NESTtoTVBInterfaces class holding a list of NESTtoTVBInterface instances"""
 
-    pass
+    def __call__(self, good_cosim_update_values_shape):
+        return self._call_at_current_time(TVBInputInterfaces.__call__, good_cosim_update_values_shape)
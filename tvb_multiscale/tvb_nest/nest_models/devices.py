@@ -348,6 +348,9 @@ class NESTParrotInputDevice(NESTInputDevice, NESTParrotPopulation):
                                                     *self._default_neurons_and_source_or_target(neurons,
                                                                                                  source_or_target))
 
+    def _GetConnectionsBatch(self, neurons=None, directions=("source", "target")):
+        return tuple(self._GetConnections(neurons, source_or_target) for source_or_target in directions)
+
     def _GetFromConnections(self, attrs=None, connections=None):
         return NESTParrotPopulation._GetFromConnections(self, attrs, connections)
 
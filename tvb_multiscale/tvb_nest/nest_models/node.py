@@ -114,8 +114,7 @@ class _NESTNodeCollection(HasTraits):
             return self.nest_instance.NodeCollection(ensure_list(nodes))
         return nodes
 
-    @property
-    def gids(self):
+    def _get_gids(self):
         """Method to get a sequence (list, tuple, array) of the individual gids of nodes's elements"""
         if self._nodes:
             return tuple(ensure_list(self._nodes.global_id))
@@ -143,6 +142,15 @@ class _NESTNodeCollection(HasTraits):
         """
         self._assert_nodes(nodes).set(values_dict)
 
+    def _SetScalar(self, attr, value):
+        """Method to set a single attribute of all the collection's nodes to the same scalar value,
+           without asserting the nodes.
+        Arguments:
+            attr: the name of the attribute.
+            value: the scalar value of the attribute.
+        """
+        self._nodes.set({attr: value})
+
     def _Get(self, attrs=None, nodes=None):
         """Method to get attributes of the Spikingcollection's nodes.
            Arguments:
@@ -178,6 +186,25 @@ class _NESTNodeCollection(HasTraits):
             kwargs = {source_or_target: nodes}
             return self.nest_instance.GetConnections(**kwargs)
 
+    def _GetConnectionsBatch(self, nodes=None, directions=("source", "target")):
+        """Method to get the connections from/to a NESTNodeCollection neuron for several directions at once,
+           asserting the NEST instance and the nodes only once.
+        Arguments:
+            nodes: nest.NodeCollection or sequence (tuple, list, array) of nodes
+                     the connections of which should be included in the output.
+            directions: sequence of directions of connections relative to the collection's nodes
+                        ("source" and/or "target"). Default = ("source", "target")
+           Returns:
+            tuple of nest.SynapseCollection instances, one per direction.
+        """
+        if getattr(type(self), "GetConnections", None) is not SpikingNodeCollection.GetConnections:
+            # Subclasses overriding GetConnections, e.g., devices, get their connections through it:
+            return SpikingNodeCollection._GetConnectionsBatch(self, nodes, directions)
+        self._assert_spiking_simulator()
+        nodes = self._assert_nodes(nodes)
+        return tuple(self.nest_instance.GetConnections(**{source_or_target: nodes})
+                     for source_or_target in directions)
+
     def _SetToConnections(self, values_dict, connections=None):
         """Method to set attributes of the connections from/to the NESTNodeCollection's nodes.
            Arguments:
@@ -1,5 +1,3 @@
-from abc import ABCMeta, ABC
-
 from tvb_multiscale.core.interfaces.models.default import DefaultTVBSpikeNetInterfaceBuilder, \
     DefaultSpikeNetRemoteInterfaceBuilder, \
     DefaultSpikeNetInterfaceBuilder, DefaultSpikeNetProxyNodesBuilder
@@ -10,8 +8,24 @@ from tvb_multiscale.tvb_netpyne.interfaces.builders import NetpyneProxyNodesBuil
     NetpyneRemoteInterfaceBuilder, TVBNetpyneInterfaceBuilder
 import numpy as np
 
-class DefaultNetpyneProxyNodesBuilder(NetpyneProxyNodesBuilder, DefaultSpikeNetProxyNodesBuilder, ABC):
-    __metaclass__ = ABCMeta
+
+_RATE_NAME = TVBtoSpikeNetModels.RATE.name
+
+# A unit scale factor, shared by all builders, and, therefore, read-only:
+_SCALE_ONE = np.ones((1,))
+_SCALE_ONE.setflags(write=False)
+
+# due to the way Netpyne generates spikes, no scaling by population size is needed
+_RATE_TRANSFORMER_PARAMS = {"scale_factor": _SCALE_ONE}
+
+
+def _clone_transformer_params(transformer_params):
+    # Shallow copy of the transformer parameters, copying only their numpy arrays:
+    return dict((key, val.copy() if isinstance(val, np.ndarray) else val)
+                for key, val in transformer_params.items())
+
+
+class DefaultNetpyneProxyNodesBuilder(NetpyneProxyNodesBuilder, DefaultSpikeNetProxyNodesBuilder):
 
     pass
 
@@ -41,24 +55,27 @@ class RedWongWangExcIOInhITVBNetpyneInterfaceBuilder(RedWongWangExcIOInhINetpyne
         RedWongWangExcIOInhITVBInterfaceBuilder.default_output_config(self)
 
         transformer_params = {}
-        if self.model == TVBtoSpikeNetModels.RATE.name:
-            # due to the way Netpyne generates spikes, no scaling by population size is needed
-            transformer_params = {"scale_factor": np.array([1.0])}
-
-        self.output_interfaces[0]["transformer_params"] = transformer_params
-        self.output_interfaces[0]["populations"] = "E"
-        self.output_interfaces[0]["proxy_params"] = {"number_of_neurons": self.N_E}
-        if self.synaptic_model_funcs:
-            self.output_interfaces[0]["receptor_type"] = self.synaptic_model_funcs()['E']
-
-        if self.lamda > 0.0:
-            from copy import deepcopy
-            self.output_interfaces[1]["transformer_params"] = deepcopy(transformer_params)
-            self.output_interfaces[1]["populations"] = "I"
-            self.output_interfaces[1]["proxy_params"] = {"number_of_neurons": self.N_I,
-                                                         "lamda": self.lamda}
-            if self.synaptic_model_funcs:
-                self.output_interfaces[1]["receptor_type"] = self.synaptic_model_funcs()['I']
+        if self.model == _RATE_NAME:
+            transformer_params = dict(_RATE_TRANSFORMER_PARAMS)
+
+        # Get the trait values and the synaptic model functions once for all output interfaces:
+        output_interfaces = self.output_interfaces
+        lamda = self.lamda
+        synaptic_model_funcs = self.synaptic_model_funcs() if self.synaptic_model_funcs else None
+
+        output_interfaces[0]["transformer_params"] = transformer_params
+        output_interfaces[0]["populations"] = "E"
+        output_interfaces[0]["proxy_params"] = {"number_of_neurons": self.N_E}
+        if synaptic_model_funcs:
+            output_interfaces[0]["receptor_type"] = synaptic_model_funcs['E']
+
+        if lamda > 0.0:
+            output_interfaces[1]["transformer_params"] = _clone_transformer_params(transformer_params)
+            output_interfaces[1]["populations"] = "I"
+            output_interfaces[1]["proxy_params"] = {"number_of_neurons": self.N_I,
+                                                    "lamda": lamda}
+            if synaptic_model_funcs:
+                output_interfaces[1]["receptor_type"] = synaptic_model_funcs['I']
 
     def default_input_config(self):
         RedWongWangExcIOInhITVBSpikeNetInterfaceBuilder.default_input_config(self)
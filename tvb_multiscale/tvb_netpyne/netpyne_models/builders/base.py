@@ -1,5 +1,4 @@
 from abc import abstractmethod
-import numpy as np
 
 from tvb_multiscale.core.spiking_models.builders.base import SpikingNetworkBuilder
 from tvb_multiscale.core.spiking_models.builders.factory import build_and_connect_devices
@@ -71,7 +70,7 @@ class NetpyneNetworkBuilder(SpikingNetworkBuilder):
            Returns:
             a NetpynePopulation class instance
         """
-        size = int(np.round(size))
+        size = int(round(size))
 
         global_label = params.get("global_label")
         population = NetpynePopulation(None, self.netpyne_instance, label, global_label, brain_region)
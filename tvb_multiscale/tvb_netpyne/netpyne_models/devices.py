@@ -5,6 +5,8 @@ from tvb_multiscale.tvb_netpyne.netpyne.utils import generateSpikesForPopulation
 
 class NetpyneDevice(HasTraits):
 
+    _cache_gids = False  # The gids depend on the state of the NetPyNE instance
+
     def __init__(self, device, netpyne_instance, *args, **kwargs):
         self.netpyne_instance = netpyne_instance
         HasTraits.__init__(self)
@@ -18,8 +20,7 @@ class NetpyneDevice(HasTraits):
             raise ValueError("No NetPyNE instance associated to this %s of model %s with label %s!" %
                              (self.__class__.__name__, self.model, self.label))
 
-    @property
-    def gids(self):
+    def _get_gids(self):
         """Method to get a sequence (list, tuple, array) of the individual gids of nodes's elements"""
         pass
 
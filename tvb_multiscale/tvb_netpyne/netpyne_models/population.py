@@ -4,6 +4,8 @@ class NetpynePopulation(SpikingPopulation):
 
     netpyne_instance = None
 
+    _cache_gids = False  # The gids depend on the state of the NetPyNE instance
+
     def __init__(self, nodes, netpyne_instance, label, global_label, brain_region, **kwargs):
         self.netpyne_instance = netpyne_instance
 
@@ -26,8 +28,7 @@ class NetpynePopulation(SpikingPopulation):
         """Overrides correpondent method of SpikingNodeCollection"""
         return len(self.gids)
 
-    @property
-    def gids(self):
+    def _get_gids(self):
         """Method to get a sequence (list, tuple, array) of the individual gids of populations' neurons"""
         gids = self.netpyne_instance.cellGidsForPop(self.global_label)
         return gids